@@ -1,6 +1,7 @@
 """Prompt engineering templates for AI generation."""
 
-from typing import Dict, List
+from functools import lru_cache
+from typing import Dict, List, Tuple
 
 
 def get_system_prompt():
@@ -288,6 +289,16 @@ def get_revelation_modifiers(revelation_level: int, breadcrumb_active: bool = Fa
         selected_hint = random.choice(hints)
         modifiers.append(f"BREADCRUMB: Weave this subtle hint into the narrative naturally: '{selected_hint}'")
     
+    modifiers.extend(_revelation_level_modifiers(revelation_level))
+    
+    return "\n".join(modifiers)
+
+
+@lru_cache(maxsize=8)
+def _revelation_level_modifiers(revelation_level: int) -> Tuple[str, ...]:
+    """Fixed modifier lines unlocked at a revelation level (the breadcrumb is the only random part)."""
+    modifiers = []
+    
     if revelation_level >= 1:
         modifiers.append("HINT: You may reference cycles, loops, or repetition occasionally.")
     
@@ -309,7 +320,33 @@ def get_revelation_modifiers(revelation_level: int, breadcrumb_active: bool = Fa
         modifiers.append("The entity running this simulation can be referenced as 'the one who hates' or 'the machine'.")
         modifiers.append("CRITICAL: Still never explicitly state 'AM' or 'I Have No Mouth'. Let players make the connection.")
     
-    return "\n".join(modifiers)
+    return tuple(modifiers)
+
+def _get_art_corruption(stat_level):
+    """Corruption instructions for ASCII art at a given stat level."""
+    if stat_level < 3:
+        return "\nThe art should be partially corrupted - some lines broken, static ▓▒░ mixed in."
+    elif stat_level < 5:
+        return "\nThe art should have minor imperfections - one or two lines slightly off."
+    return ""
+
+
+def get_scene_art_request(stat_level):
+    """Extra instructions asking for ASCII art in the same response as a scene."""
+    corruption = _get_art_corruption(stat_level)
+    
+    return f"""
+
+KEY MOMENT - ALSO DRAW IT:
+After the CHOICES, add a final section starting with "ART:" containing DETAILED,
+ATMOSPHERIC ASCII art of the most striking concrete image in the scene you just wrote.
+- LARGE and DETAILED (15-20 lines tall, 30-40 characters wide)
+- Use box-drawing characters: ─ │ ╱ ╲ ┌ ┐ └ ┘ ╔ ╗ ╚ ╝ ═ ║ ╭ ╮ ╰ ╯
+- Use shading: █ ▓ ▒ ░ ▪ ▫ ● ○ ◉ ◎
+- Make it CREEPY and DETAILED{corruption}
+
+Output the art as plain text after "ART:" - no explanations or markdown blocks."""
+
 
 def get_ascii_art_prompt(subject, mood, stat_level):
     """Generate detailed ASCII art with specific constraints."""
@@ -351,12 +388,7 @@ BAD examples (avoid vague blobs):
     else:
         specific_hint = "Draw with clear, recognizable shapes. Avoid abstract blobs."
     
-    # Corruption instructions
-    corruption = ""
-    if stat_level < 3:
-        corruption = "\nThe art should be partially corrupted - some lines broken, static ▓▒░ mixed in."
-    elif stat_level < 5:
-        corruption = "\nThe art should have minor imperfections - one or two lines slightly off."
+    corruption = _get_art_corruption(stat_level)
     
     return f"""Create DETAILED, ATMOSPHERIC ASCII art of: {subject}
 Mood: {mood}
@@ -647,11 +679,11 @@ def get_mutation_prompt_context(active_mutations: List) -> str:
 def get_opening_scene_prompt(scenario_data=None):
     """
     Special prompt for the game's opening.
-    If scenario_data provided, uses that. Otherwise uses default mysterious opening.
+    If scenario_data (an OpeningPlan) is provided, uses that. Otherwise uses default mysterious opening.
     """
     if scenario_data:
         # Use scenario-specific opening
-        return scenario_data.get('opening_prompt', '')
+        return scenario_data.opening_prompt
     
     # Default opening if no scenario provided
     return """Generate the opening scene for a literary horror CYOA game called ~ATH.
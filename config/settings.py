@@ -47,6 +47,20 @@ VISUAL_INTENSITY = {
 DEFAULT_MODEL = "claude-sonnet-4-5-20250929"
 MAX_TOKENS = 800
 TEMPERATURE = 0.9  # Higher for more creative/unpredictable output
+SCENE_ART_TOKENS = 400  # Extra budget when a scene also carries ASCII art
+
+# Speculative prefetch: generate the next scene for the first few choices while
+# the player reads. Costs up to SPECULATIVE_PREFETCH_LIMIT requests per turn.
+SPECULATIVE_PREFETCH = False
+SPECULATIVE_PREFETCH_LIMIT = 2
+
+# Response cache: replay stored scenes for game states seen before (same
+# scenario, revelation level, choice and recent narrative). Handy for
+# development; off by default since it trades away variety on replays. Openings
+# are also keyed by the ghost-memory session count, so only a replay of the same
+# session (e.g. after deleting .ghost_memory) gets the same opening again.
+RESPONSE_CACHE_ENABLED = False
+RESPONSE_CACHE_FILE = ".response_cache"
 
 # Truth/Revelation System (IHNMAIMS easter egg)
 REVELATION_THRESHOLDS = {
@@ -59,7 +73,7 @@ REVELATION_THRESHOLDS = {
 }
 
 # Scenario System (story variety)
-SCENARIO_VARIETY_MEMORY = 3  # Track last N scenarios to avoid repeats
+SCENARIO_VARIETY_MEMORY = 8  # Track last N scenarios to avoid repeats (was 3)
 THEME_CONSISTENCY = True  # Maintain theme throughout session
 
 # Event Pacing (forced progression)
@@ -2,15 +2,61 @@
 
 import os
 import random
-from typing import Dict, List, Optional
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, Dict, List, Optional, Tuple
 from anthropic import Anthropic
 from config.prompts import (
     get_system_prompt,
     get_scene_generation_prompt,
+    get_scene_art_request,
     get_ascii_art_prompt,
     get_opening_scene_prompt
 )
-from config.settings import DEFAULT_MODEL, MAX_TOKENS, TEMPERATURE
+from config.settings import (
+    DEFAULT_MODEL,
+    MAX_TOKENS,
+    TEMPERATURE,
+    SPECULATIVE_PREFETCH_LIMIT,
+    RESPONSE_CACHE_ENABLED,
+    RESPONSE_CACHE_FILE,
+    SCENE_ART_TOKENS
+)
+from engine.response_cache import ResponseCache, build_state_key, narrative_digest
+
+
+class _PendingScene:
+    """A scene generating in the background whose streamed text can be followed later."""
+    
+    def __init__(self):
+        self.future: Optional[Future] = None
+        self._chunks: List[str] = []
+        self._listener: Optional[Callable[[str], None]] = None
+        self._lock = threading.Lock()
+        self.cancelled = threading.Event()  # Checked by the stream between chunks
+    
+    def receive(self, text: str):
+        """Record a streamed chunk and pass it on to any follower."""
+        with self._lock:
+            self._chunks.append(text)
+            if self._listener:
+                self._listener(text)
+    
+    def follow(self, on_text: Callable[[str], None]):
+        """Replay the text received so far to on_text, then forward the rest as it arrives."""
+        with self._lock:
+            for text in self._chunks:
+                on_text(text)
+            self._listener = on_text
+    
+    def cancel(self):
+        """Drop the request if it is still queued, or end its stream at the next chunk."""
+        self.cancelled.set()
+        self.future.cancel()
+    
+    def result(self):
+        """Wait for the background result."""
+        return self.future.result()
 
 
 class AIAdapter:
@@ -47,24 +93,30 @@ class AIAdapter:
         self.art_cache: Dict[str, str] = {}  # Cache generated art
         self.recent_lengths: List[int] = []  # Track recent narrative lengths
         self.recent_choice_counts: List[int] = []  # Track recent choice counts
+        self.prefetched: Dict[str, _PendingScene] = {}  # Speculative scenes keyed by base prompt
+        # Scenes the game will certainly show get their own worker, so they never
+        # queue behind speculative requests that are still winding down
+        self._scene_pool = ThreadPoolExecutor(max_workers=1)
+        self._speculation_pool = ThreadPoolExecutor(max_workers=SPECULATIVE_PREFETCH_LIMIT)
+        self.response_cache = ResponseCache(RESPONSE_CACHE_FILE) if RESPONSE_CACHE_ENABLED else None
+        self.scenario_key = ''  # Set by the opening, part of every cache key
+        self.theme_key = ''
+        self.session_salt = 0  # Ghost-memory session count, so openings don't replay across sessions
     
-    def generate_opening(self, scenario_data=None) -> Dict[str, any]:
-        """Generate the opening scene of the game."""
+    def generate_opening(self, scenario_data=None,
+                         on_text: Optional[Callable[[str], None]] = None) -> Dict[str, any]:
+        """Generate the opening scene of the game, streaming chunks to on_text."""
         try:
             opening_prompt = get_opening_scene_prompt(scenario_data)
+            if scenario_data is not None:
+                self.scenario_key = scenario_data.scenario.key
+                self.theme_key = scenario_data.theme.key
             
-            response = self.client.messages.create(
-                model=self.model,
-                max_tokens=MAX_TOKENS,
-                temperature=TEMPERATURE,
-                system=self.system_prompt,
-                messages=[{
-                    "role": "user",
-                    "content": opening_prompt
-                }]
-            )
-            
-            content = response.content[0].text
+            cache_key = build_state_key(self.scenario_key, self.theme_key, self.session_salt, 'opening')
+            content = self._cached_response(cache_key)
+            if content is None:
+                content = self._stream_text(opening_prompt, on_text)
+                self._store_response(cache_key, content)
             
             # Store in conversation history
             self.conversation_history.append({
@@ -97,6 +149,31 @@ class AIAdapter:
                 "error": True
             }
     
+    def _stream_text(self, prompt: str, on_text: Optional[Callable[[str], None]] = None,
+                     max_tokens: int = MAX_TOKENS, stop: Optional[threading.Event] = None) -> str:
+        """Stream a narrative completion, handing each text chunk to on_text as it arrives.
+        
+        Setting stop ends the stream early; leaving the block closes the connection.
+        """
+        chunks = []
+        with self.client.messages.stream(
+            model=self.model,
+            max_tokens=max_tokens,
+            temperature=TEMPERATURE,
+            system=self.system_prompt,
+            messages=[{
+                "role": "user",
+                "content": prompt
+            }]
+        ) as stream:
+            for text in stream.text_stream:
+                if stop is not None and stop.is_set():
+                    break
+                chunks.append(text)
+                if on_text:
+                    on_text(text)
+        return ''.join(chunks)
+    
     def get_variety_hint(self) -> str:
         """Generate hints to encourage variety in output length."""
         import random
@@ -133,28 +210,40 @@ class AIAdapter:
         
         return "\n".join(hints)
     
-    def generate_scene(self, context: Dict) -> Dict[str, any]:
-        """Generate next scene based on current context."""
+    def generate_scene(self, context: Dict,
+                       on_text: Optional[Callable[[str], None]] = None) -> Dict[str, any]:
+        """Generate next scene based on current context, streaming chunks to on_text."""
         try:
-            # Add variety hint to context
-            variety_hint = self.get_variety_hint()
-            if variety_hint:
-                context['variety_hint'] = variety_hint
-            
-            prompt = get_scene_generation_prompt(context)
-            
-            response = self.client.messages.create(
-                model=self.model,
-                max_tokens=MAX_TOKENS,
-                temperature=TEMPERATURE,
-                system=self.system_prompt,
-                messages=[{
-                    "role": "user",
-                    "content": prompt
-                }]
-            )
+            base_prompt, _ = self._scene_request(context)
+            # A speculative generation for this exact context may already be in flight
+            pending = self._take_prefetched(base_prompt)
+            # Replayed game states come straight from the response cache
+            cache_key = self._scene_cache_key(context)
+            prompt, content = base_prompt, self._cached_response(cache_key)
             
-            content = response.content[0].text
+            if content is not None:
+                if pending:
+                    pending.cancel()
+            else:
+                if pending:
+                    if on_text:
+                        pending.follow(on_text)
+                    try:
+                        prompt, content = pending.result()
+                    except Exception:
+                        content = None  # Failed speculation - fall back to a fresh request
+                
+                if content is None:
+                    # Add variety hint to context
+                    variety_hint = self.get_variety_hint()
+                    if variety_hint:
+                        context['variety_hint'] = variety_hint
+                    
+                    prompt, max_tokens = self._scene_request(context)
+                    
+                    content = self._stream_text(prompt, on_text, max_tokens)
+                
+                self._store_response(cache_key, content)
             
             # Update conversation history (keep last 6 exchanges to manage context)
             self.conversation_history.append({
@@ -170,7 +259,10 @@ class AIAdapter:
             if len(self.conversation_history) > 12:
                 self.conversation_history = self.conversation_history[-12:]
             
-            return self._parse_response(content)
+            scene = self._parse_response(content)
+            # Art is shown for the moment this scene was written for, not the next turn's stats
+            scene['art_requested'] = self.should_generate_art(context)
+            return scene
             
         except Exception as e:
             # Debug logging
@@ -189,6 +281,84 @@ class AIAdapter:
                 "error": True
             }
     
+    def _scene_request(self, context: Dict) -> Tuple[str, int]:
+        """Prompt and token budget for a scene, asking for art in the same response at key moments."""
+        prompt = get_scene_generation_prompt(context)
+        if self.should_generate_art(context):
+            prompt += get_scene_art_request(context['hidden_stats']['sanity'])
+            return prompt, MAX_TOKENS + SCENE_ART_TOKENS
+        return prompt, MAX_TOKENS
+    
+    def _scene_cache_key(self, context: Dict) -> str:
+        """Cache key for the game state a scene is generated from."""
+        return build_state_key(
+            self.scenario_key,
+            self.theme_key,
+            context.get('revelation_level', 0),
+            context.get('previous_choice', 'BEGIN'),
+            narrative_digest(context.get('recent_narrative', '')),
+            narrative_digest(context.get('mutation_context', ''))
+        )
+    
+    def _cached_response(self, key: str) -> Optional[str]:
+        """Look up a stored response when the cache is enabled."""
+        return self.response_cache.get(key) if self.response_cache else None
+    
+    def _store_response(self, key: str, content: str):
+        """Remember a response when the cache is enabled."""
+        if self.response_cache:
+            self.response_cache.set(key, content)
+    
+    def prefetch_scenes(self, contexts: List[Dict]):
+        """Start generating candidate next scenes in the background while the player reads."""
+        self.discard_prefetched()
+        for context in contexts:
+            base_prompt, _ = self._scene_request(context)
+            if base_prompt not in self.prefetched:
+                self.prefetched[base_prompt] = self._submit_scene(context, self._speculation_pool)
+    
+    def start_scene(self, context: Dict):
+        """Start generating the scene for context now; generate_scene collects it later."""
+        base_prompt, _ = self._scene_request(context)
+        # Keep a matching speculative scene, drop the rest
+        pending = self._take_prefetched(base_prompt)
+        if pending is None:
+            if self._cached_response(self._scene_cache_key(context)) is not None:
+                return
+            pending = self._submit_scene(context, self._scene_pool)
+        self.prefetched[base_prompt] = pending
+    
+    def _submit_scene(self, context: Dict, pool: ThreadPoolExecutor) -> _PendingScene:
+        """Queue a scene request on a background pool."""
+        variety_hint = self.get_variety_hint()
+        if variety_hint:
+            context = dict(context, variety_hint=variety_hint)  # Leave the caller's context as the lookup key
+        prompt, max_tokens = self._scene_request(context)
+        
+        pending = _PendingScene()
+        pending.future = pool.submit(
+            lambda: (prompt, self._stream_text(prompt, pending.receive, max_tokens, pending.cancelled))
+        )
+        return pending
+    
+    def start_opening(self, scenario_data=None) -> _PendingScene:
+        """Start generating the opening in the background while the intro plays."""
+        pending = _PendingScene()
+        pending.future = self._scene_pool.submit(self.generate_opening, scenario_data, pending.receive)
+        return pending
+    
+    def _take_prefetched(self, base_prompt: str) -> Optional[_PendingScene]:
+        """Claim the speculative scene for base_prompt, dropping every other candidate."""
+        pending = self.prefetched.pop(base_prompt, None)
+        self.discard_prefetched()
+        return pending
+    
+    def discard_prefetched(self):
+        """Cancel speculative scenes that were not chosen."""
+        for pending in self.prefetched.values():
+            pending.cancel()  # Running requests stop at their next chunk
+        self.prefetched.clear()
+    
     def generate_free_text_response(self, user_text: str, context: Dict) -> Dict[str, any]:
         """Generate AI response to free-text player input."""
         try:
@@ -238,7 +408,10 @@ Be creative. React authentically to their words. Make their input matter."""
             if len(self.conversation_history) > 12:
                 self.conversation_history = self.conversation_history[-12:]
             
-            return self._parse_response(content)
+            scene = self._parse_response(content)
+            # Art is shown for the moment this scene was written for, not the next turn's stats
+            scene['art_requested'] = self.should_generate_art(context)
+            return scene
             
         except Exception as e:
             return {
@@ -278,6 +451,10 @@ Be creative. React authentically to their words. Make their input matter."""
         if len(content) < 50:
             print(f"[DEBUG] Short AI response: {content[:100]}")
         
+        # Art drawn alongside the scene comes last; keep it out of the text parsing
+        content, _, art = content.partition('\nART:')
+        art = '\n'.join(line.rstrip() for line in art.strip('\n').split('\n') if not line.startswith('```'))
+        
         lines = content.split('\n')
         narrative = ""
         choices = []
@@ -384,6 +561,7 @@ Be creative. React authentically to their words. Make their input matter."""
             "narrative": narrative.strip(),
             "choices": choices[:4],  # Max 4 choices
             "consequences": consequences,
+            "ascii_art": art.strip('\n') or None,
             "error": False
         }
     
@@ -491,42 +669,40 @@ Be creative. React authentically to their words. Make their input matter."""
         ]
         return random.choice(default_subjects)
     
-    def generate_ending_narrative(self, ending, context: Dict) -> Dict[str, str]:
-        """
-        Generate AI-driven ending narrative with final ASCII art.
-        Returns: {'narrative': str, 'ascii_art': str}
-        """
+    def generate_ending_narrative(self, ending, context: Dict,
+                                  on_text: Optional[Callable[[str], None]] = None) -> str:
+        """Generate AI-driven ending narrative, streaming chunks to on_text."""
         from config.prompts import get_ending_generation_prompt
         
         prompt = get_ending_generation_prompt(ending, context)
         
         try:
-            response = self.client.messages.create(
+            chunks = []
+            with self.client.messages.stream(
                 model=self.model,
                 max_tokens=800,  # Longer for endings
                 temperature=0.8,
                 messages=[{"role": "user", "content": prompt}]
-            )
+            ) as stream:
+                for text in stream.text_stream:
+                    chunks.append(text)
+                    if on_text:
+                        on_text(text)
             
-            content = response.content[0].text.strip()
-            narrative = content
-            
-            # Generate final ASCII art
-            art_subject = self._get_ending_art_subject(ending, context)
-            ascii_art = self.generate_ascii_art(art_subject[0], art_subject[1], 
-                                                context['hidden_stats']['sanity'])
-            
-            return {
-                'narrative': narrative,
-                'ascii_art': ascii_art
-            }
+            return ''.join(chunks).strip()
             
         except Exception as e:
             # Fallback to basic ending
-            return {
-                'narrative': ending.ai_seed if hasattr(ending, 'ai_seed') else "The story ends here.",
-                'ascii_art': self._get_fallback_ending_art(ending.ending_category if hasattr(ending, 'ending_category') else 'death')
-            }
+            return ending.ai_seed if hasattr(ending, 'ai_seed') else "The story ends here."
+    
+    def generate_ending_art(self, ending, context: Dict) -> str:
+        """Generate the final ASCII art for an ending."""
+        art_subject = self._get_ending_art_subject(ending, context)
+        art = self.generate_ascii_art(art_subject[0], art_subject[1],
+                                      context['hidden_stats']['sanity'])
+        if '[ART CORRUPTED]' in art:
+            return self._get_fallback_ending_art(ending.ending_category if hasattr(ending, 'ending_category') else 'death')
+        return art
     
     def _get_ending_art_subject(self, ending, context: Dict) -> tuple[str, str]:
         """Get appropriate ASCII art subject for ending type."""
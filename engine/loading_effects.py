@@ -455,6 +455,8 @@ class ContinuousAnimation:
         self.choice_count = choice_count
         self.message_override = message_override
         self.live = None
+        self.preview = None
+        self.streamed = []
         self.animation_type = random.choice(['spinner', 'dots', 'pulse', 'corruption', 'matrix'])
         
     def __enter__(self):
@@ -478,9 +480,34 @@ class ContinuousAnimation:
         """Stop the animation."""
         if self.live:
             self.live.stop()
+        if self.preview:
+            self.preview.stop()
         self.console.print()  # Add spacing after
         return False
     
+    def feed(self, chunk: str):
+        """Show streamed narrative as it arrives, replacing the animation on the first chunk."""
+        self.streamed.append(chunk)
+        text = ''.join(self.streamed)
+        # Only the narrative section is worth showing; the rest is bookkeeping
+        text = text.split('CONSEQUENCES:')[0].split('CHOICES:')[0].replace('NARRATIVE:', '')
+        text = ' '.join(text.split())
+        if not text:
+            return
+        
+        width = max(self.console.width - 4, 20)
+        frame = Text(text[-width:], style="dim italic")
+        
+        if self.preview is None:
+            # Detach first so the animation threads stop touching the display
+            animation, self.live = self.live, None
+            if animation:
+                animation.stop()
+            self.preview = Live(frame, console=self.console, refresh_per_second=10, transient=True)
+            self.preview.start()
+        else:
+            self.preview.update(frame)
+    
     def _start_spinner(self):
         """Spinning animation with messages."""
         if self.message_override:
@@ -2,10 +2,16 @@
 
 import random
 import time
+from collections import deque
 from typing import Dict, List, Optional, Tuple
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from enum import Enum
 
+from config.settings import MUTATION_GUARANTEED_AT
+
+# Set form for the per-turn membership test
+_GUARANTEED_TURNS = frozenset(MUTATION_GUARANTEED_AT)
+
 
 class MutationType(Enum):
     """Category of mutation."""
@@ -43,6 +49,7 @@ class Mutation:
     can_stack: bool  # Can be active with other mutations
     fade_narrative: str  # How it ends in story
     requires_special_input: bool = False  # Needs non-standard input
+    idx: int = field(default=-1, repr=False)  # Stable table index (assigned at import)
     
     def __eq__(self, other):
         if isinstance(other, Mutation):
@@ -819,8 +826,11 @@ class MutationManager:
         """Initialize mutation manager."""
         self.active_mutations: List[Tuple[Mutation, int, MutationState]] = []  # (mutation, turns_remaining, state)
         self.mutation_history: List[str] = []
+        self._recent_ids: deque = deque(maxlen=5)  # idx of the last 5 picks
+        self._recent_mask = 0  # Bit i set => mutation idx i used recently
         self.cooldown = 0
         self.combo_active: Optional[str] = None  # Active combo effect
+        self.state: Optional[MutationState] = None  # Manager phase (None = idle)
     
     def check_mutation(self, context: Dict) -> List[Mutation]:
         """
@@ -829,28 +839,61 @@ class MutationManager:
         """
         from engine.debug import debug_log
         
-        choice_count = context.get('choice_count', 0)
+        debug_log(f"\n[DEBUG MUTATION] Turn {context.get('choice_count', 0)}: Checking mutations (state={self.state})...")
         
-        # DEBUG OUTPUT
-        debug_log(f"\n[DEBUG MUTATION] Turn {choice_count}: Checking mutations...")
-        debug_log(f"[DEBUG MUTATION] Active mutations: {len(self.active_mutations)}")
-        debug_log(f"[DEBUG MUTATION] Cooldown: {self.cooldown}")
+        handler = self._STATE_TABLE[self.state]
+        self.state, new_mutation = handler(self, context)
         
-        # Update existing mutations
-        self._update_active_mutations()
+        if new_mutation:
+            self.state = MutationState.ACTIVE
         
-        # Decrement cooldown
-        if self.cooldown > 0:
-            self.cooldown -= 1
-            debug_log(f"[DEBUG MUTATION] Cooldown decremented to {self.cooldown}")
+        # Check for combos
+        self._check_combos()
         
-        # GUARANTEED MUTATIONS - Import from settings
-        from config.settings import MUTATION_GUARANTEED_AT
+        # Return only mutations that are actually active (not fading/expired)
+        active = [m for m, turns, state in self.active_mutations if turns > 0]
+        debug_log(f"[DEBUG MUTATION] Returning {len(active)} active mutations: {[m.name for m in active]}")
+        return active
+    
+    def _tick_idle(self, context: Dict) -> Tuple[Optional[MutationState], Optional[Mutation]]:
+        """Idle phase: nothing tracked, only roll for a new mutation."""
+        return None, self._roll_new_mutation(context)
+    
+    def _tick_running(self, context: Dict) -> Tuple[Optional[MutationState], Optional[Mutation]]:
+        """Active or fading phase: age and expire tracked mutations, then roll (stacking allowed)."""
+        self._update_active_mutations()
+        return self._phase(), self._roll_new_mutation(context)
+
+    # Manager phase -> per-turn handler (one dict lookup instead of nested ifs)
+    _STATE_TABLE = {
+        None: _tick_idle,
+        MutationState.ACTIVE: _tick_running,
+        MutationState.FADING: _tick_running,
+    }
+
+    def _phase(self) -> Optional[MutationState]:
+        """Derive the manager phase from the tracked mutations."""
+        if not self.active_mutations:
+            return None
+        if any(turns > 0 for _, turns, _ in self.active_mutations):
+            return MutationState.ACTIVE
+        return MutationState.FADING
+    
+    def _roll_new_mutation(self, context: Dict) -> Optional[Mutation]:
+        """Handle cooldown and guaranteed turns; activate and return a new mutation, if any."""
+        from engine.debug import debug_log
         
-        debug_log(f"[DEBUG MUTATION] Guaranteed turns: {MUTATION_GUARANTEED_AT}")
+        # Fast path: still cooling down and not a guaranteed turn - touch nothing else
+        if self.cooldown > 1:
+            self.cooldown -= 1
+            if context.get('choice_count', 0) not in _GUARANTEED_TURNS:
+                debug_log(f"[DEBUG MUTATION] Skipping (cooldown: {self.cooldown})")
+                return None
+        elif self.cooldown == 1:
+            self.cooldown = 0
         
         # Force mutation on guaranteed turns (even if cooldown active)
-        if choice_count in MUTATION_GUARANTEED_AT:
+        if context.get('choice_count', 0) in _GUARANTEED_TURNS:
             debug_log(f"[DEBUG MUTATION] GUARANTEED TURN! Forcing mutation...")
             new_mutation = self._try_trigger_mutation(context)
             if not new_mutation:  # If random failed, force one
@@ -861,26 +904,16 @@ class MutationManager:
                 self._activate_mutation(new_mutation)
                 # Don't set cooldown after guaranteed mutations!
                 self.cooldown = 0
-        elif self.cooldown == 0:
-            # Normal mutation check
-            debug_log(f"[DEBUG MUTATION] Cooldown at 0, trying random mutation...")
-            new_mutation = self._try_trigger_mutation(context)
-            if new_mutation:
-                debug_log(f"[DEBUG MUTATION] ✓ Activated: {new_mutation.name}")
-                self._activate_mutation(new_mutation)
-            else:
-                debug_log(f"[DEBUG MUTATION] Random check failed")
-        else:
-            debug_log(f"[DEBUG MUTATION] Skipping (cooldown: {self.cooldown})")
+            return new_mutation
         
-        # Check for combos
-        self._check_combos()
-        
-        # Return only mutations that are actually active (not fading/expired)
-        active = [m for m, turns, state in self.active_mutations if turns > 0]
-        debug_log(f"[DEBUG MUTATION] Returning {len(active)} active mutations: {[m.name for m in active]}")
-        debug_log(f"[DEBUG MUTATION] Total tracked (including fading): {len(self.active_mutations)}")
-        return active
+        # Normal mutation check (cooldown is 0 here)
+        new_mutation = self._try_trigger_mutation(context)
+        if new_mutation:
+            debug_log(f"[DEBUG MUTATION] ✓ Activated: {new_mutation.name}")
+            self._activate_mutation(new_mutation)
+        else:
+            debug_log(f"[DEBUG MUTATION] Random check failed")
+        return new_mutation
     
     def _update_active_mutations(self):
         """Update durations and states of active mutations."""
@@ -914,54 +947,60 @@ class MutationManager:
     
     def _try_trigger_mutation(self, context: Dict) -> Optional[Mutation]:
         """Try to trigger a new mutation based on context."""
+        from engine.debug import debug_log
+        
         choice_count = context.get('choice_count', 0)
-        revelation_level = context.get('revelation_level', 0)
-        instability = context.get('instability_level', 0)
         
         # Escalating frequency based on game progress - MUCH HIGHER CHANCES
         if choice_count <= 3:
-            # Very early game: 40% chance (was 10%), COMMON MODERATE only
-            base_chance = 0.40
-            pool = [m for m in self.MODERATE_MUTATIONS if m.rarity == MutationRarity.COMMON]
+            base_chance = 0.40  # Very early game (was 10%)
         elif choice_count <= 8:
-            # Early game: 50% chance (was 20%), all MODERATE
-            base_chance = 0.50
-            pool = self.MODERATE_MUTATIONS.copy()
+            base_chance = 0.50  # Early game (was 20%)
         elif choice_count <= 15:
-            # Mid game: 60% chance (was 30%), MODERATE + UNCOMMON WILD
-            base_chance = 0.60
-            pool = self.MODERATE_MUTATIONS.copy()
-            pool.extend([m for m in self.WILD_MUTATIONS if m.rarity in [MutationRarity.COMMON, MutationRarity.UNCOMMON]])
+            base_chance = 0.60  # Mid game (was 30%)
         elif choice_count <= 25:
-            # Late game: 70% chance (was 40%), all MODERATE + WILD, RARE possible
-            base_chance = 0.70
-            pool = self.MODERATE_MUTATIONS.copy() + self.WILD_MUTATIONS.copy()
+            base_chance = 0.70  # Late game (was 40%)
         else:
-            # End game: 80% chance (was 50%), everything including ULTRA_RARE
-            base_chance = 0.80
-            pool = self.MODERATE_MUTATIONS.copy() + self.WILD_MUTATIONS.copy()
-        
-        from engine.debug import debug_log
+            base_chance = 0.80  # End game (was 50%)
         
         # Adjust by instability
-        final_chance = base_chance + (instability * 0.05)
-        
-        debug_log(f"[DEBUG MUTATION] Base chance: {base_chance*100}%, Final chance: {final_chance*100}%, Pool size: {len(pool)}")
+        final_chance = base_chance + (context.get('instability_level', 0) * 0.05)
+        if final_chance <= 0:
+            return None
         
         roll = random.random()
         debug_log(f"[DEBUG MUTATION] Rolled: {roll:.2f} vs {final_chance:.2f}")
         
         if roll < final_chance:
-            debug_log(f"[DEBUG MUTATION] Success! Selecting mutation from pool...")
+            # Only build the pool once the roll has succeeded
+            pool = self._pool_for_turn(choice_count)
+            debug_log(f"[DEBUG MUTATION] Success! Selecting mutation from pool of {len(pool)}...")
             return self._select_mutation(pool, context)
         
         debug_log(f"[DEBUG MUTATION] Failed roll")
         return None
     
+    def _pool_for_turn(self, choice_count: int) -> List[Mutation]:
+        """Candidate mutations unlocked at this point in the game."""
+        if choice_count <= 3:
+            # COMMON MODERATE only
+            return [m for m in self.MODERATE_MUTATIONS if m.rarity == MutationRarity.COMMON]
+        elif choice_count <= 8:
+            # All MODERATE
+            return self.MODERATE_MUTATIONS.copy()
+        elif choice_count <= 15:
+            # MODERATE + COMMON/UNCOMMON WILD
+            pool = self.MODERATE_MUTATIONS.copy()
+            pool.extend([m for m in self.WILD_MUTATIONS if m.rarity in [MutationRarity.COMMON, MutationRarity.UNCOMMON]])
+            return pool
+        # Late/end game: everything, RARE and ULTRA_RARE included
+        return self.MODERATE_MUTATIONS.copy() + self.WILD_MUTATIONS.copy()
+    
     def _select_mutation(self, pool: List[Mutation], context: Dict) -> Mutation:
         """Select a mutation from pool based on rarity."""
-        # Filter out recently used
-        available = [m for m in pool if m.key not in self.mutation_history[-5:]]
+        # Filter out recently used (single int AND per candidate)
+        mask = self._recent_mask
+        available = [m for m in pool if not (mask >> m.idx) & 1]
         if not available:
             available = pool
         
@@ -986,9 +1025,18 @@ class MutationManager:
         
         chosen = random.choices(available, weights=weights)[0]
         self.mutation_history.append(chosen.key)
+        self._remember(chosen.idx)
         
         return chosen
     
+    def _remember(self, idx: int):
+        """Push a mutation id into the recent ring and rebuild the bitmask."""
+        self._recent_ids.append(idx)
+        mask = 0
+        for i in self._recent_ids:
+            mask |= 1 << i
+        self._recent_mask = mask
+    
     def _force_mutation(self, context: Dict) -> Mutation:
         """Force a mutation to occur (for guaranteed turns)."""
         choice_count = context.get('choice_count', 0)
@@ -1062,4 +1110,19 @@ class MutationManager:
         """Load mutation state from save."""
         self.mutation_history = state.get('mutation_history', [])
         self.cooldown = state.get('cooldown', 0)
+        self._recent_ids.clear()
+        self._recent_mask = 0
+        for key in self.mutation_history[-5:]:
+            if key in _MUTATION_IDX_BY_KEY:
+                self._remember(_MUTATION_IDX_BY_KEY[key])
+
+
+# Assign each mutation a stable integer id for the recent-history bitmask
+for _idx, _mutation in enumerate(MutationManager.MODERATE_MUTATIONS + MutationManager.WILD_MUTATIONS):
+    _mutation.idx = _idx
+del _idx, _mutation
+
+_MUTATION_IDX_BY_KEY = {
+    m.key: m.idx for m in MutationManager.MODERATE_MUTATIONS + MutationManager.WILD_MUTATIONS
+}
 
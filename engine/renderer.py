@@ -1,7 +1,13 @@
 """Rich-based rendering system with typing effects and visual layouts."""
 
+import sys
+import math
 import time
 import random
+import select
+from bisect import bisect_right
+from contextlib import contextmanager
+from functools import lru_cache
 from typing import List, Optional
 from rich.console import Console
 from rich.panel import Panel
@@ -11,6 +17,111 @@ from rich.table import Table
 from rich import box
 from rich.align import Align
 from rich.columns import Columns
+from rich.live import Live
+
+
+# Static title/game-over blocks, built once so Rich skips markup parsing per call
+_TITLE_TEXT = Text("""
+    ╔═══════════════════════════════════════╗
+    ║                                       ║
+    ║              ~ A T H                  ║
+    ║                                       ║
+    ║     a story that shouldn't exist     ║
+    ║                                       ║
+    ╚═══════════════════════════════════════╝
+        """, style="bold cyan")
+
+_GAME_OVER_HEADER = Text("""
+╔════════════════════════════════════════════╗
+║                                            ║
+║              T E R M I N A T E D           ║
+║                                            ║
+╚════════════════════════════════════════════╝
+""", style="dim red")
+
+# Single-pass markup escaping. Rich only needs '[' escaped; an escaped ']'
+# would print a stray backslash.
+_MARKUP_TRANS = str.maketrans({'[': '\\['})
+
+
+@lru_cache(maxsize=512)
+def _escape_short(text: str) -> str:
+    return text.translate(_MARKUP_TRANS)
+
+
+def _escape_cached(text: str) -> str:
+    """Escape markup, memoizing short strings (status comments, prompts repeat)."""
+    if len(text) > 512:
+        return text.translate(_MARKUP_TRANS)
+    return _escape_short(text)
+
+
+# Special-moment text variants; whispers and emphasis lines repeat a lot
+@lru_cache(maxsize=256)
+def _mirror(text: str) -> str:
+    return text[::-1]
+
+
+@lru_cache(maxsize=256)
+def _spaced_upper(text: str) -> str:
+    return ' '.join(text.upper())
+
+
+@lru_cache(maxsize=256)
+def _lowered(text: str) -> str:
+    return text.lower()
+
+
+def _moment_variant(variant, text: str) -> str:
+    """Apply a cached variant, bypassing the cache for long one-off text."""
+    if len(text) > 256:
+        return variant.__wrapped__(text)
+    return variant(text)
+
+
+_DEBUG_MGR = None
+
+
+def _get_debug():
+    """Resolve the debug manager on first use, then reuse it."""
+    global _DEBUG_MGR
+    if _DEBUG_MGR is None:
+        from engine.debug import DebugManager
+        _DEBUG_MGR = DebugManager
+    return _DEBUG_MGR
+
+
+# Block glyphs used by the corruption effects
+_GLITCH_CHARS = '█▓▒░'
+
+# Shared Panel/Table configuration for the glitch panel and narrator split
+_GLITCH_PANEL_STYLE = {"border_style": "red", "box": box.DOUBLE}
+_GLITCH_PANEL_TITLE = ("S̴Y̷S̶T̸E̷M̴ ̸E̷R̶R̸O̷R̴\n\n", "bold red")
+_GLITCH_PANEL_FOOTER = ("\n\n(continuing anyway...)", "dim")
+_SPLIT_COLUMNS = (("Narrator A", "cyan"), ("Narrator B", "magenta"))
+
+
+def _make_split_table() -> Table:
+    """Fresh two-narrator table built from the cached column config."""
+    table = Table(show_header=True, header_style="bold", box=box.SIMPLE)
+    for header, style in _SPLIT_COLUMNS:
+        table.add_column(header, style=style, width=35)
+    return table
+
+
+_STATS_PANEL_STYLE = {"title": "[bold]Status[/]", "border_style": "dim white", "box": box.ROUNDED, "padding": (0, 1)}
+
+
+def _make_stats_panel(body: str) -> Panel:
+    """Status panel around body, built from the cached panel config."""
+    return Panel(body, **_STATS_PANEL_STYLE)
+
+
+# DEC mode 2026: terminal buffers output between these and paints it in one frame
+_SYNC_BEGIN = '\x1b[?2026h'
+_SYNC_END = '\x1b[?2026l'
+
+_GAME_OVER_FOOTER = Text("Session ended.\n\n(the story is already forgetting you)\n", style="dim red")
 
 
 class Renderer:
@@ -18,46 +129,85 @@ class Renderer:
     
     # Dynamic color palettes for different moods
     COLOR_PALETTES = {
-        'stable': ['white', 'bright_white', 'grey70'],
-        'unsettled': ['cyan', 'bright_cyan', 'blue', 'white'],
-        'disturbed': ['yellow', 'bright_yellow', 'orange1', 'gold1'],
-        'breaking': ['red', 'bright_red', 'orange_red1', 'dark_orange'],
-        'collapsed': ['magenta', 'bright_magenta', 'purple', 'violet', 'red'],
-        'horror': ['red', 'dark_red', 'red3', 'indian_red'],
-        'glitch': ['green', 'bright_green', 'cyan', 'magenta', 'yellow'],
-        'void': ['grey30', 'grey23', 'grey15', 'black'],
+        'stable': ('white', 'bright_white', 'grey70'),
+        'unsettled': ('cyan', 'bright_cyan', 'blue', 'white'),
+        'disturbed': ('yellow', 'bright_yellow', 'orange1', 'gold1'),
+        'breaking': ('red', 'bright_red', 'orange_red1', 'dark_orange'),
+        'collapsed': ('magenta', 'bright_magenta', 'purple', 'violet', 'red'),
+        'horror': ('red', 'dark_red', 'red3', 'indian_red'),
+        'glitch': ('green', 'bright_green', 'cyan', 'magenta', 'yellow'),
+        'void': ('grey30', 'grey23', 'grey15', 'black'),
     }
     
+    # Intensity -> palette: bisect_right(thresholds, intensity) indexes the tuple
+    _INTENSITY_THRESHOLDS = (0.2, 0.4, 0.6, 0.8)
+    
+    # int(expovariate(rate)) + 1 with this rate is geometric with p = 0.1,
+    # i.e. the same odds as an independent 10% roll per loading screen
+    _TRICK_RATE = -math.log(0.9)
+    _PALETTE_BY_LEVEL = (
+        COLOR_PALETTES['stable'],
+        COLOR_PALETTES['unsettled'],
+        COLOR_PALETTES['disturbed'],
+        COLOR_PALETTES['breaking'],
+        COLOR_PALETTES['collapsed'],
+    )
+    
     def __init__(self):
         """Initialize the renderer."""
         self.console = Console()
         self.typing_speed = 0.02  # Base typing speed
         self.current_palette = 'stable'
         self.interrupt_count = 0  # Track Ctrl+C attempts across entire session
+        
+        # Private RNG with pre-bound methods for the hot paths (and one place to seed)
+        self._rand = random.Random()
+        self._rand_random = self._rand.random
+        self._rand_choice = self._rand.choice
+        self._rand_uniform = self._rand.uniform
+        
+        # Mutation banners rotate through a fixed set of pre-built glitch lines
+        self._glitch_line_pool = tuple(
+            ''.join(self._rand.choices(_GLITCH_CHARS, k=40)) for _ in range(16)
+        )
+        self._glitch_idx = 0
+        
+        # Loading screens left until the next trick
+        self._next_trick = self._roll_next_trick()
+    
+    @contextmanager
+    def _sync_output(self):
+        """Paint everything printed inside the block atomically (synchronized output)."""
+        if not self.console.is_terminal:
+            yield
+            return
+        
+        self.console.file.write(_SYNC_BEGIN)
+        try:
+            yield
+        finally:
+            self.console.file.write(_SYNC_END)
+            self.console.file.flush()
     
     @staticmethod
     def escape_markup(text: str) -> str:
         """Escape Rich markup characters to prevent parsing errors."""
-        return text.replace('[', '\\[').replace(']', '\\]')
+        return text.translate(_MARKUP_TRANS)
     
     def get_dynamic_color(self, intensity: float = 0.0) -> str:
         """Get a color based on current intensity."""
-        if intensity >= 0.8:
-            palette = self.COLOR_PALETTES['collapsed']
-        elif intensity >= 0.6:
-            palette = self.COLOR_PALETTES['breaking']
-        elif intensity >= 0.4:
-            palette = self.COLOR_PALETTES['disturbed']
-        elif intensity >= 0.2:
-            palette = self.COLOR_PALETTES['unsettled']
-        else:
-            palette = self.COLOR_PALETTES['stable']
-        
-        return random.choice(palette)
+        palette = self._PALETTE_BY_LEVEL[bisect_right(self._INTENSITY_THRESHOLDS, intensity)]
+        return palette[int(self._rand_random() * len(palette))]
+    
+    def get_dynamic_colors(self, intensity: float, n: int) -> List[str]:
+        """Get n colors for the current intensity in one call."""
+        palette = self._PALETTE_BY_LEVEL[bisect_right(self._INTENSITY_THRESHOLDS, intensity)]
+        return self._rand.choices(palette, k=n)
     
     def get_random_color_from_palette(self, palette_name: str) -> str:
         """Get random color from a specific palette."""
-        return random.choice(self.COLOR_PALETTES.get(palette_name, ['white']))
+        palette = self.COLOR_PALETTES.get(palette_name, ('white',))
+        return palette[int(self._rand_random() * len(palette))]
     
     def clear(self):
         """Clear the screen."""
@@ -65,18 +215,24 @@ class Renderer:
     
     def show_loading(self, message: str = "[LOADING...]", duration: float = 1.0):
         """Show a loading message."""
-        # Occasionally mess with the player
-        if random.random() < 0.1:  # 10% chance
-            tricks = [
+        # Occasionally mess with the player (~10% of loads, via countdown)
+        self._next_trick -= 1
+        if self._next_trick <= 0:
+            self._next_trick = self._roll_next_trick()
+            tricks = (
                 self._loading_trick_fake_error,
                 self._loading_trick_watching,
                 self._loading_trick_slow,
-            ]
-            random.choice(tricks)(message, duration)
+            )
+            self._rand_choice(tricks)(message, duration)
         else:
             with self.console.status(message, spinner="dots"):
                 time.sleep(duration)
     
+    def _roll_next_trick(self) -> int:
+        """Draw how many loading screens pass before the next trick."""
+        return int(self._rand.expovariate(self._TRICK_RATE)) + 1
+    
     def _loading_trick_fake_error(self, message: str, duration: float):
         """Fake an error during loading."""
         with self.console.status(message, spinner="dots"):
@@ -104,30 +260,58 @@ class Renderer:
     
     def type_text(self, text: str, speed: Optional[float] = None, style: str = ""):
         """Type out text character by character with proper animation."""
-        from rich.live import Live
-        from rich.text import Text
-        
         speed = speed or self.typing_speed
         
-        # Escape any Rich markup in the text for safety
-        safe_text = text.replace('[', '\\[').replace(']', '\\]')
-        
-        # Build text progressively with Live display
-        displayed_text = Text()
-        
-        with Live(displayed_text, console=self.console, refresh_per_second=30) as live:
-            for char in safe_text:
-                displayed_text.append(char, style=style)
-                live.update(displayed_text)
-                
-                # Add delay for non-whitespace characters
-                if char not in [' ', '\n', '\t']:
-                    time.sleep(speed * random.uniform(0.5, 1.5))
-                elif char == ' ':
-                    time.sleep(speed * 0.3)
+        # Wrap once with Rich's wrapper so line breaks match a normal print
+        wrapped = '\n'.join(line.plain for line in Text(text).wrap(self.console, self.console.width))
+        
+        # Style escape codes, rendered once (empty when output isn't a color terminal)
+        with self.console.capture() as capture:
+            self.console.print("x", style=style, end="", markup=False, highlight=False)
+        style_on, _, style_off = capture.get().partition("x")
+        
+        # Per-character delays up front: non-whitespace varies, spaces are quick
+        uniform = self._rand_uniform
+        delays = [
+            speed * uniform(0.5, 1.5) if char not in ' \n\t'
+            else speed * 0.3 if char == ' '
+            else 0.0
+            for char in wrapped
+        ]
+        
+        # Write raw characters (no markup parsing, no re-render of earlier text),
+        # flushing at most once per ~33ms frame
+        frame = 1 / 30
+        pending = 0.0
+        out = self.console.file
+        out.write(style_on)
+        
+        for char, delay in zip(wrapped, delays):
+            out.write(char)
+            pending += delay
+            if pending >= frame:
+                out.flush()
+                time.sleep(pending)
+                pending = 0.0
+        
+        out.write(style_off)
+        out.flush()
+        if pending:
+            time.sleep(pending)
         
         self.console.print()  # Newline after animation completes
     
+    @contextmanager
+    def live_text(self, style: str = ""):
+        """Show text growing as chunks arrive; yields the callback to feed chunks to."""
+        chunks = []
+        with Live(Text("", style=style), console=self.console, refresh_per_second=20, transient=True) as live:
+            def feed(chunk: str):
+                chunks.append(chunk)
+                live.update(Text(''.join(chunks), style=style))
+            
+            yield feed
+    
     def show_narrative(self, narrative: str, interjection: Optional[str] = None, intensity: float = 0.0):
         """Display narrative text with optional narrator interjection - DYNAMIC COLORS."""
         # Adjust typing speed based on intensity
@@ -151,29 +335,35 @@ class Renderer:
     
     def show_choices(self, choices: List[str], intensity: float = 0.0):
         """Display choice options - DYNAMIC COLORS."""
-        self.console.print()
-        
-        # Get dynamic colors for choices
-        for i, choice in enumerate(choices, 1):
-            # Each choice gets a slightly different color
-            choice_color = self.get_dynamic_color(intensity)
-            number_color = self.get_random_color_from_palette('horror' if intensity > 0.7 else 'disturbed' if intensity > 0.4 else 'stable')
+        # Each choice gets a slightly different color
+        choice_colors = self.get_dynamic_colors(intensity, len(choices))
+        number_palette = 'horror' if intensity > 0.7 else 'disturbed' if intensity > 0.4 else 'stable'
+        
+        # Build the whole menu as one Text so it renders in a single pass
+        out = Text("\n")
+        for i, (choice, choice_color) in enumerate(zip(choices, choice_colors), 1):
+            number_color = self.get_random_color_from_palette(number_palette)
             
             # Add visual corruption to choices at high intensity
-            if intensity > 0.7 and random.random() < 0.3:
+            if intensity > 0.7 and self._rand_random() < 0.3:
                 choice = self._corrupt_text(choice)
             
-            self.console.print(f"  [bold {number_color}]{i}[/]. [{choice_color}]{choice}[/]")
+            out.append("  ")
+            out.append(str(i), style=f"bold {number_color}")
+            out.append(". ")
+            out.append(choice, style=choice_color)
+            out.append("\n")
         
-        self.console.print()
+        with self._sync_output():
+            self.console.print(out)
     
     def get_choice_input(self, num_choices: int, secret_check_callback=None) -> int:
         """Get player's choice input (with optional secret word detection)."""
         # Very rarely, pretend someone else is typing
-        if random.random() < 0.03:  # 3% chance
+        if self._rand_random() < 0.03:  # 3% chance
             self.console.print("[bold green]>[/] ", end="")
             time.sleep(0.5)
-            fake_choice = random.randint(1, num_choices)
+            fake_choice = self._rand.randint(1, num_choices)
             for char in str(fake_choice):
                 self.console.print(char, end="")
                 time.sleep(0.2)
@@ -190,8 +380,7 @@ class Renderer:
                 
                 # Check for debug toggle command
                 if choice.lower().strip() == 'debug':
-                    from engine.debug import DebugManager
-                    DebugManager.toggle()
+                    _get_debug().toggle()
                     continue  # Ask for input again
                 
                 # Check for secret words if callback provided
@@ -247,24 +436,6 @@ class Renderer:
     
     def get_timed_choice_input(self, choices: List[str], timeout: int = 10) -> int:
         """Get choice input with countdown timer."""
-        import threading
-        from rich.live import Live
-        from rich.text import Text
-        
-        result = {'choice': None, 'timed_out': False}
-        
-        def countdown_display():
-            """Display countdown."""
-            for remaining in range(timeout, 0, -1):
-                if result['choice'] is not None:
-                    break
-                time.sleep(1)
-            result['timed_out'] = True
-        
-        # Start countdown in background
-        timer_thread = threading.Thread(target=countdown_display, daemon=True)
-        timer_thread.start()
-        
         # Show choices with timer
         self.console.print()
         for i, choice in enumerate(choices, 1):
@@ -272,28 +443,64 @@ class Renderer:
         
         self.console.print(f"\n[bold red]⏰ You have {timeout} seconds[/]\n")
         
-        start_time = time.time()
-        while time.time() - start_time < timeout:
+        deadline = time.monotonic() + timeout
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            
+            self.console.print(f"[dim]({int(remaining) + 1}s)[/] [bold green]>[/] ", end="")
             try:
-                choice = self.console.input(f"[bold green]>[/] ")
-                choice_num = int(choice)
+                line = self._read_line_until(deadline)
+            except KeyboardInterrupt:
+                self.console.print()
+                continue
+            if not line:  # Timed out or EOF
+                break
+            
+            try:
+                choice_num = int(line)
                 if 1 <= choice_num <= len(choices):
-                    result['choice'] = choice_num - 1
-                    return result['choice']
-            except (ValueError, KeyboardInterrupt):
+                    return choice_num - 1
+            except ValueError:
                 pass
-            
-            if result['timed_out']:
-                break
         
         # Timeout - return random choice
         self.console.print("\n[bold red]⏰ TIME'S UP[/]")
         time.sleep(0.5)
-        default = random.randint(0, len(choices) - 1)
+        default = self._rand.randint(0, len(choices) - 1)
         self.console.print(f"[dim]The narrator chooses for you: {choices[default]}[/]")
         time.sleep(1)
         return default
     
+    def _read_line_until(self, deadline: float) -> Optional[str]:
+        """Read one line from stdin, or return None once the deadline passes."""
+        if sys.platform == 'win32':
+            import msvcrt
+            buf = []
+            while time.monotonic() < deadline:
+                while msvcrt.kbhit():
+                    ch = msvcrt.getwche()
+                    if ch in '\r\n':
+                        self.console.print()
+                        return ''.join(buf) or ' '
+                    if ch == '\b':
+                        if buf:
+                            buf.pop()
+                    else:
+                        buf.append(ch)
+                time.sleep(0.05)
+            return None
+        
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return None
+            ready, _, _ = select.select([sys.stdin], [], [], min(remaining, 0.25))
+            if ready:
+                # readline() keeps the newline, so a blank entry is still truthy
+                return sys.stdin.readline()
+    
     def get_coordinate_input(self, art: str, prompt: str = "Enter coordinates") -> tuple[int, int]:
         """Get coordinate input for ASCII art interaction."""
         self.console.print(f"\n{art}\n", style="cyan")
@@ -334,16 +541,15 @@ class Renderer:
         self.console.print(f"\n{narrative_with_blanks}\n")
         self.console.print("[bold yellow]Fill in the blanks:[/]\n")
         
-        # Count blanks
-        blank_count = narrative_with_blanks.count('_____')
+        # Blanks split the narrative into blank_count + 1 segments
+        blank_count = len(narrative_with_blanks.split('_____')) - 1
         
-        answers = []
+        answers = ["[...]"] * blank_count
         for i in range(blank_count):
             try:
-                answer = self.console.input(f"[bold green]Blank {i+1}>[/] ")
-                answers.append(answer.strip())
+                answers[i] = self.console.input(f"[bold green]Blank {i+1}>[/] ").strip()
             except (KeyboardInterrupt, EOFError):
-                answers.append("[...]")
+                pass
         
         return answers
     
@@ -364,21 +570,14 @@ class Renderer:
         if not visible:
             return
         
-        health_percent = stats['health'] / stats['max_health']
+        health, max_health = stats['health'], stats['max_health']
+        health_percent = health / max_health
         health_color = "green" if health_percent > 0.6 else "yellow" if health_percent > 0.3 else "red"
         
-        stats_text = f"""[{health_color}]HP:[/] {stats['health']}/{stats['max_health']}
+        stats_text = f"""[{health_color}]HP:[/] {health}/{max_health}
 [cyan]STR:[/] {stats['strength']}  [cyan]SPD:[/] {stats['speed']}  [cyan]INT:[/] {stats['intelligence']}"""
         
-        panel = Panel(
-            stats_text,
-            title="[bold]Status[/]",
-            border_style="dim white",
-            box=box.ROUNDED,
-            padding=(0, 1)
-        )
-        
-        self.console.print(panel)
+        self.console.print(_make_stats_panel(stats_text))
     
     def show_ascii_art(self, art: str, intensity: float = 0.0):
         """Display ASCII art with potential corruption - DYNAMIC COLORS."""
@@ -387,7 +586,7 @@ class Renderer:
         
         for line in lines:
             # Corrupt some lines at high intensity
-            if intensity > 0.6 and random.random() < intensity * 0.3:
+            if intensity > 0.6 and self._rand_random() < intensity * 0.3:
                 line = self._corrupt_text(line)
             corrupted_lines.append(line)
         
@@ -395,61 +594,61 @@ class Renderer:
         art_color = self.get_dynamic_color(intensity)
         
         # Occasionally use horror or glitch palette for extra creepiness
-        if random.random() < 0.3:
+        if self._rand_random() < 0.3:
             art_color = self.get_random_color_from_palette('horror' if intensity > 0.5 else 'glitch')
         
-        self.console.print(Align.center('\n'.join(corrupted_lines)), style=f"bold {art_color}")
-        self.console.print()
+        with self._sync_output():
+            self.console.print(Align.center('\n'.join(corrupted_lines)), style=f"bold {art_color}")
+            self.console.print()
+    
+    def _reveal_lines(self, lines: List[str], style: str, delay: float):
+        """Reveal lines one at a time; all Rich rendering happens before the timed loop."""
+        rendered = []
+        for line in lines:
+            with self.console.capture() as capture:
+                self.console.print(line, style=style)
+            rendered.append(capture.get())
+        
+        out = self.console.file
+        for chunk in rendered:
+            out.write(chunk)
+            out.flush()
+            time.sleep(delay)
     
     def show_scattered_text(self, lines: List[str]):
         """Display scattered text effect."""
-        for line in lines:
-            self.console.print(line, style="dim white")
-            time.sleep(0.1)
+        self._reveal_lines(lines, "dim white", 0.1)
     
     def show_spiral_text(self, lines: List[str]):
         """Display spiraling text effect."""
-        for line in lines:
-            self.console.print(line, style="yellow")
-            time.sleep(0.15)
+        self._reveal_lines(lines, "yellow", 0.15)
     
     def show_vertical_text(self, lines: List[str]):
         """Display vertical text effect."""
-        for line in lines:
-            self.console.print(line, style="white")
-            time.sleep(0.08)
+        self._reveal_lines(lines, "white", 0.08)
     
     def show_ghost_memory(self, fragments: List[str]):
         """Display ghost memory fragments."""
         if not fragments:
             return
         
-        self.console.print()
-        self.console.print("[dim italic]...memory fragments detected...[/]", style="cyan")
-        time.sleep(0.5)
+        shown = fragments[:3]  # Show max 3 fragments
         
-        for fragment in fragments[:3]:  # Show max 3 fragments
-            self.console.print(f"  [dim cyan]{fragment}[/]")
-            time.sleep(0.3)
+        # One block, one paint; the pause afterwards keeps the old total pacing
+        block = Text("\n")
+        block.append("...memory fragments detected...\n", style="dim italic cyan")
+        for fragment in shown:
+            block.append(f"  {fragment}\n", style="dim cyan")
         
-        self.console.print()
+        self.console.print(block)
+        time.sleep(0.5 + 0.3 * len(shown))
     
     def show_opening_title(self, ghost_hint: Optional[str] = None):
         """Display opening sequence."""
-        self.clear()
-        
-        # ~ATH title
-        title = """
-    ╔═══════════════════════════════════════╗
-    ║                                       ║
-    ║              ~ A T H                  ║
-    ║                                       ║
-    ║     a story that shouldn't exist     ║
-    ║                                       ║
-    ╚═══════════════════════════════════════╝
-        """
-        
-        self.console.print(title, style="bold cyan")
+        # Clear and draw the ~ATH title in one frame (no blank flash)
+        with self._sync_output():
+            self.clear()
+            self.console.print(_TITLE_TEXT)
         time.sleep(1)
         
         if ghost_hint:
@@ -462,57 +661,39 @@ class Renderer:
     
     def show_game_over(self, message: str, narrator_comment: str, choice_count: int):
         """Display game over screen."""
-        self.console.print("\n\n")
-        
-        game_over_text = f"""
-╔════════════════════════════════════════════╗
-║                                            ║
-║              T E R M I N A T E D           ║
-║                                            ║
-╚════════════════════════════════════════════╝
-
-{message}
-
-{narrator_comment}
-
-Choices made: {choice_count}
-Session ended.
-
-(the story is already forgetting you)
-        """
-        
-        self.console.print(game_over_text, style="dim red")
+        with self._sync_output():
+            self.console.print("\n\n")
+            self.console.print(_GAME_OVER_HEADER)
+            self.console.print(Text(f"{message}\n\n{narrator_comment}\n\nChoices made: {choice_count}", style="dim red"))
+            self.console.print(_GAME_OVER_FOOTER)
         time.sleep(2)
     
     def show_error_glitch(self, error_message: str):
         """Show an error as a narrative glitch."""
-        glitch_panel = Panel(
-            f"[bold red]S̴Y̷S̶T̸E̷M̴ ̸E̷R̶R̸O̷R̴[/]\n\n{error_message}\n\n[dim](continuing anyway...)[/]",
-            border_style="red",
-            box=box.DOUBLE
-        )
+        body = Text.assemble(_GLITCH_PANEL_TITLE, error_message, _GLITCH_PANEL_FOOTER)
+        glitch_panel = Panel(body, **_GLITCH_PANEL_STYLE)
         self.console.print(glitch_panel)
         time.sleep(1)
     
     def show_status_comment(self, comment: str):
         """Show narrator comment on player status."""
-        self.console.print(f"\n  [dim italic yellow]{comment}[/]")
+        self.console.print(f"\n  [dim italic yellow]{_escape_cached(comment)}[/]")
         time.sleep(0.5)
     
     def _corrupt_text(self, text: str) -> str:
-        """Apply simple corruption to text."""
-        chars = list(text)
-        for i in range(len(chars)):
-            if random.random() < 0.1 and chars[i].isalpha():
-                chars[i] = random.choice(['█', '▓', '▒', '░', chars[i]])
-        return ''.join(chars)
+        """Apply simple corruption to text (~8% of letters become glitch blocks)."""
+        # One random byte per char: values below 20 (20/256) glitch the letter
+        return ''.join(
+            _GLITCH_CHARS[b & 3] if b < 20 and char.isalpha() else char
+            for char, b in zip(text, self._rand.randbytes(len(text)))
+        )
     
     def show_special_moment(self, moment_type: str, text: str):
         """Display special typographic moments."""
         if moment_type == "mirror":
             # Show text and its mirror
             self.console.print(f"\n{text}", style="white")
-            reversed_text = text[::-1]
+            reversed_text = _moment_variant(_mirror, text)
             self.console.print(f"{reversed_text}\n", style="dim white")
         
         elif moment_type == "falling":
@@ -524,13 +705,12 @@ Session ended.
         
         elif moment_type == "emphasis":
             # Big emphasis
-            emphasized = text.upper()
-            spaced = ' '.join(emphasized)
+            spaced = _moment_variant(_spaced_upper, text)
             self.console.print(f"\n\n  {spaced}\n\n", style="bold white")
         
         elif moment_type == "whisper":
             # Very small/dim
-            self.console.print(f"\n  {text.lower()}\n", style="dim italic")
+            self.console.print(f"\n  {_moment_variant(_lowered, text)}\n", style="dim italic")
     
     def show_scenario_title(self, scenario_art: str):
         """Display scenario announcement with ASCII art."""
@@ -540,8 +720,8 @@ Session ended.
     def show_mutation_announcement(self, mutation):
         """Display mutation announcement."""
         # Visual glitch effect
-        glitch_chars = ['█', '▓', '▒', '░']
-        glitch_line = ''.join(random.choice(glitch_chars) for _ in range(40))
+        glitch_line = self._glitch_line_pool[self._glitch_idx & 15]
+        self._glitch_idx += 1
         
         self.console.print(f"\n{glitch_line}", style="red")
         time.sleep(0.3)
@@ -553,9 +733,7 @@ Session ended.
     
     def show_narrator_split(self, narrative1: str, narrative2: str):
         """Show two narrators arguing in columns."""
-        table = Table(show_header=True, header_style="bold", box=box.SIMPLE)
-        table.add_column("Narrator A", style="cyan", width=35)
-        table.add_column("Narrator B", style="magenta", width=35)
+        table = _make_split_table()
         
         # Split narratives into chunks
         words1 = narrative1.split()
@@ -566,9 +744,10 @@ Session ended.
         
         table.add_row(chunk1, chunk2)
         
-        self.console.print("\n[bold red][TWO VOICES DETECTED][/]\n")
-        self.console.print(table)
-        self.console.print("[dim](both claim to be the narrator)[/]\n")
+        with self._sync_output():
+            self.console.print("\n[bold red][TWO VOICES DETECTED][/]\n")
+            self.console.print(table)
+            self.console.print("[dim](both claim to be the narrator)[/]\n")
     
     def show_format_corruption(self, text: str, corruption_type: str):
         """Display text in corrupted formats."""
@@ -590,6 +769,10 @@ Session ended.
         
         elif corruption_type == "ascii":
             # Heavy ASCII glitching
-            glitched = ''.join(random.choice(['█', '▓', '▒', '░', c]) if random.random() < 0.4 else c for c in text)
+            # One random byte per char: below 82 (~32%, was 40% x 4/5) becomes a block
+            glitched = ''.join(
+                _GLITCH_CHARS[b & 3] if b < 82 else c
+                for c, b in zip(text, self._rand.randbytes(len(text)))
+            )
             self.console.print(f"\n{glitched}\n", style="yellow")
 
@@ -0,0 +1,59 @@
+"""Persistent cache of AI responses for replayed game states."""
+
+import hashlib
+import sqlite3
+import threading
+from typing import Optional
+
+
+def build_state_key(*parts) -> str:
+    """Combine the parts of a game state into a single cache key."""
+    return hashlib.sha256('|'.join(str(part) for part in parts).encode()).hexdigest()
+
+
+def narrative_digest(text: str, tail: int = 400) -> str:
+    """Short digest of the end of a narrative, where the current situation lives."""
+    return hashlib.blake2b(text[-tail:].encode(), digest_size=8).hexdigest()
+
+
+class ResponseCache:
+    """SQLite-backed store mapping state keys to raw AI responses."""
+
+    def __init__(self, path: str):
+        """Open (or create) the cache file."""
+        self.path = path
+        self._conn = None
+        # Openings are generated on a background thread, so the connection is
+        # shared across threads and serialized by this lock
+        self._lock = threading.Lock()
+        try:
+            self._conn = sqlite3.connect(path, check_same_thread=False)
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS responses (key TEXT PRIMARY KEY, content TEXT NOT NULL)"
+            )
+            self._conn.commit()
+        except sqlite3.Error:
+            # An unusable cache just means every request goes to the API
+            self._conn = None
+
+    def get(self, key: str) -> Optional[str]:
+        """Return the cached response for key, if any."""
+        if self._conn is None:
+            return None
+        try:
+            with self._lock:
+                row = self._conn.execute("SELECT content FROM responses WHERE key = ?", (key,)).fetchone()
+        except sqlite3.Error:
+            return None
+        return row[0] if row else None
+
+    def set(self, key: str, content: str):
+        """Store a response under key."""
+        if self._conn is None:
+            return
+        try:
+            with self._lock:
+                self._conn.execute("INSERT OR REPLACE INTO responses (key, content) VALUES (?, ?)", (key, content))
+                self._conn.commit()
+        except sqlite3.Error:
+            pass
@@ -1,10 +1,13 @@
 """Session management and ghost memory system."""
 
+import copy
 import json
 import os
 import hashlib
+import threading
 from datetime import datetime
-from typing import Dict, List, Optional
+from typing import Dict, List, Mapping, Optional, Sequence
+from config.settings import SCENARIO_VARIETY_MEMORY
 
 
 class SessionManager:
@@ -16,6 +19,9 @@ class SessionManager:
         """Initialize session manager."""
         self.session_start = datetime.now()
         self.ghost_memory = self._load_ghost_memory()
+        self._save_lock = threading.Lock()
+        self._pending_save = None  # Newest snapshot waiting for the background writer
+        self._save_thread: Optional[threading.Thread] = None
     
     def _load_ghost_memory(self) -> Dict:
         """Load ghost memory from previous sessions."""
@@ -45,16 +51,17 @@ class SessionManager:
                 "truth_tracker": {}
             }
     
-    def save_ghost_memory(self, choices: List[str], final_state: Dict, truth_state: Optional[Dict] = None, 
-                          scenario_used: Optional[str] = None, mutations_encountered: Optional[List[str]] = None):
+    def save_ghost_memory(self, choices: Sequence[str], final_state: Dict, truth_state: Optional[Dict] = None, 
+                          scenario_used: Optional[int] = None, mutations_encountered: Optional[List[str]] = None):
         """Save cryptic fragments for next session."""
         # Hash choices to obscure them
-        choice_hashes = [hashlib.md5(c.encode()).hexdigest()[:8] for c in choices[-5:]]
+        choice_hashes = [hashlib.md5(c.encode()).hexdigest()[:8] for c in list(choices)[-5:]]
         
         # Create cryptic fragments
         fragments = []
         if len(choices) > 0:
-            fragments.append(f"trace: {len(choices)} decisions recorded")
+            # choices may be a bounded history; the state summary has the full count
+            fragments.append(f"trace: {final_state.get('choice_count', len(choices))} decisions recorded")
         
         if final_state.get('character_stats', {}).get('health', 100) <= 0:
             fragments.append("termination: biological")
@@ -75,10 +82,10 @@ class SessionManager:
         elif new_session_count > 109:
             fragments.append(f"iteration: {new_session_count}. persistence noted.")
         
-        # Track scenarios (last 8 for better variety)
+        # Track scenarios as compact ids (last SCENARIO_VARIETY_MEMORY for better variety)
         scenarios = self.ghost_memory.get('scenarios', [])
-        if scenario_used:
-            scenarios = (scenarios + [scenario_used])[-8:]  # Keep last 8 (was 3)
+        if scenario_used is not None:
+            scenarios = (scenarios + [scenario_used])[-SCENARIO_VARIETY_MEMORY:]
         
         # Track mutations seen
         mutations = self.ghost_memory.get('mutations_seen', [])
@@ -96,13 +103,46 @@ class SessionManager:
             "mutations_seen": mutations
         }
         
+        # Write beside the real file and swap it in, so an interrupted write
+        # never leaves a truncated ghost file behind
+        tmp_path = f"{self.GHOST_FILE}.tmp"
         try:
-            with open(self.GHOST_FILE, 'w') as f:
+            with open(tmp_path, 'w') as f:
                 json.dump(ghost_data, f, indent=2)
+            os.replace(tmp_path, self.GHOST_FILE)
         except Exception:
             # If we can't write, that's thematically fine
             pass
     
+    def queue_ghost_memory(self, choices: Sequence[str], final_state: Dict, truth_state: Optional[Dict] = None,
+                           scenario_used: Optional[int] = None, mutations_encountered: Optional[List[str]] = None):
+        """Save ghost memory in the background; a newer snapshot replaces one still waiting."""
+        # The state summary holds live read-only views of the stats; copy them so
+        # the writer thread sees this turn's values, not whatever the game has now
+        state = {key: dict(value) if isinstance(value, Mapping) else value for key, value in final_state.items()}
+        snapshot = (list(choices), state, copy.deepcopy(truth_state), scenario_used, mutations_encountered)
+        with self._save_lock:
+            self._pending_save = snapshot
+            if self._save_thread is None:
+                self._save_thread = threading.Thread(target=self._drain_ghost_saves, daemon=True)
+                self._save_thread.start()
+    
+    def flush_ghost_memory(self):
+        """Wait for any background ghost memory write to finish."""
+        thread = self._save_thread
+        if thread is not None:
+            thread.join()
+    
+    def _drain_ghost_saves(self):
+        """Background writer: keep saving the newest snapshot until none is waiting."""
+        while True:
+            with self._save_lock:
+                snapshot, self._pending_save = self._pending_save, None
+                if snapshot is None:
+                    self._save_thread = None
+                    return
+            self.save_ghost_memory(*snapshot)
+    
     def get_opening_memory_hint(self) -> Optional[str]:
         """Get a cryptic hint about previous sessions for the opening."""
         if self.ghost_memory.get("sessions", 0) == 0:
@@ -1,8 +1,11 @@
 """Core story engine with dual stat systems and state management."""
 
 import random
-from typing import Dict, List, Optional
-from copy import deepcopy
+import re
+from bisect import bisect_right
+from collections import deque
+from types import MappingProxyType
+from typing import Deque, Dict, List, Optional, Set
 from config.settings import (
     DEFAULT_CHARACTER_STATS,
     DEFAULT_HIDDEN_STATS,
@@ -11,38 +14,205 @@ from config.settings import (
 )
 
 
+_CRITICAL_EVENTS = frozenset(CRITICAL_EVENTS)
+
+# Ring buffers: only the latest choices/discoveries are ever read back
+_CHOICE_HISTORY_LIMIT = 32
+_DISCOVERY_LIMIT = 8
+
+# Choice danger keywords, mapped to a tier index into _TIER_NAMES.
+# Single words match whole tokens; phrases match as substrings.
+_WORD_RE = re.compile(r"[a-z']+")
+_INSTANT_DEATH_PHRASES = ('obvious trap', 'clearly dangerous', 'suicide')
+_INSTANT_DEATH_RE = re.compile('|'.join(_INSTANT_DEATH_PHRASES))
+_TIER_NAMES = ('none', 'low', 'medium', 'high', 'extreme')
+_DANGER_MAP = {
+    'attack': 4, 'charge': 4, 'fight': 4,
+    'investigate': 3, 'touch': 3, 'open': 3, 'enter': 3, 'confront': 3,
+    'explore': 2, 'follow': 2, 'pursue': 2,
+    'look': 1, 'listen': 1, 'observe': 1, 'cautious': 1,
+}
+_DANGER_PHRASES = (('confront directly', 4), ('examine closely', 2))
+# Legacy keyword consequences: (damage lo, damage hi, sanity range or None)
+_DANGER_TABLE = {
+    'extreme': (20, 30, (-2, -1)),
+    'high': (15, 25, (-1, 0)),
+    'medium': (10, 20, None),
+    'low': (5, 10, None),
+}
+
+# Visual intensity by choice count (thresholds ascending, one level past each)
+_INTENSITY_THRESHOLDS = (
+    PROGRESSION_CONFIG['minor_breakdown_at'],
+    PROGRESSION_CONFIG['major_breakdown_at'],
+    PROGRESSION_CONFIG['reality_collapse_at'],
+)
+_INTENSITY_LEVELS = ('stable', 'disturbed', 'breaking', 'collapsed')
+
+# Narrator asides after taking damage, by danger level
+_FEEDBACKS = {
+    'extreme': (
+        "(that was unwise)",
+        "(brave, but stupid)",
+        "You pay the price.",
+        "(ouch)",
+    ),
+    'high': (
+        "(that cost you)",
+        "Your health suffers.",
+        "(was it worth it?)",
+        "Pain follows.",
+    ),
+    'medium': (
+        "(careful...)",
+        "That hurt.",
+        "(consequences)",
+    ),
+    'low': (
+        "(you felt that)",
+        "A small price.",
+    ),
+}
+
+# Positive steering (what to explore) rather than negative (what to avoid)
+_FRESH_CONCEPTS = (
+    'geometric impossibility', 'mathematical horror', 'sensory confusion',
+    'bureaucratic nightmare', 'linguistic breakdown', 'archaeological dread',
+    'chemical transformation', 'quantum uncertainty', 'biological invasion',
+    'architectural wrongness', 'temporal paradox', 'gravity distortion',
+    'sound-based horror', 'tactile wrongness', 'olfactory nightmare',
+    'pressure changes', 'temperature extremes', 'spatial compression',
+    'crowd horror', 'absence of expected', 'too many of something',
+    'scale distortion', 'texture horror', 'pattern recognition failure',
+)
+
+# Obvious-trap choices: any indicator phrase, or a warning word inside the first
+# parenthetical, e.g. "Drink it (poison?)"
+_TRAP_INDICATORS = (
+    'ignore warning', 'ignore the warning', 'ignore all',
+    'obviously', 'despite', 'anyway', 'against',
+    'clearly dangerous', 'strange liquid', 'unknown substance',
+    'trust the', 'believe the', 'follow the monster',
+    'touch the', 'grab the', 'drink the', 'eat the',
+    'step into the trap', 'walk into',
+)
+_TRAP_WARNING_WORDS = ('poison', 'danger', 'trap', 'dead', 'death', 'hurt', 'bad', 'kill', 'fatal')
+_TRAP_RE = re.compile(
+    '|'.join(map(re.escape, _TRAP_INDICATORS))
+    + r'|^[^()]*\([^)]*(?:' + '|'.join(_TRAP_WARNING_WORDS) + r')[^)]*\)',
+    re.IGNORECASE,
+)
+
+# Horror trope keywords, matched as substrings of the narrative
+_HORROR_CONCEPTS = {
+    'doppelganger': ['doppelganger', 'double', 'twin', 'copy', 'duplicate', 'reflection that moves', 'other you', 'another you', 'identical'],
+    'mirror': ['mirror', 'reflection', 'glass'],
+    'pursuit': ['chasing', 'following', 'pursuing', 'hunting you'],
+    'transformation': ['changing', 'transforming', 'morphing', 'becoming'],
+    'voices': ['voices', 'whispers', 'speaking', 'calling'],
+    'darkness': ['darkness', 'shadow', 'dark', 'blackness'],
+    'eyes': ['eyes watching', 'staring', 'gaze', 'observing'],
+    'doors': ['door', 'doorway', 'entrance', 'threshold'],
+    'time_loop': ['again', 'repeat', 'before', 'déjà vu', 'happened before'],
+    'body_horror': ['flesh', 'skin', 'bones', 'organs', 'blood'],
+    'isolation': ['alone', 'empty', 'abandoned', 'no one'],
+    'fragmentation': ['pieces', 'fragments', 'breaking apart', 'dissolving'],
+}
+
+# One pass over the narrative: the lookahead finds the longest keyword starting
+# at each position, and _HORROR_HITS adds every concept whose keyword is a prefix
+# of it (so 'reflection that moves' still counts for 'mirror' too).
+_HORROR_KEYWORDS = sorted(
+    {kw for kws in _HORROR_CONCEPTS.values() for kw in kws}, key=lambda kw: (-len(kw), kw)
+)
+_HORROR_RE = re.compile('(?=(' + '|'.join(map(re.escape, _HORROR_KEYWORDS)) + '))')
+_HORROR_HITS = {
+    kw: frozenset(
+        concept for concept, kws in _HORROR_CONCEPTS.items()
+        if any(kw.startswith(k) for k in kws)
+    )
+    for kw in _HORROR_KEYWORDS
+}
+
+
 class StoryEngine:
     """Manages game state, stats, and progression."""
     
     def __init__(self):
         """Initialize the story engine."""
-        self.character_stats = deepcopy(DEFAULT_CHARACTER_STATS)
-        self.hidden_stats = deepcopy(DEFAULT_HIDDEN_STATS)
+        # Flat dicts of ints: a shallow copy is enough
+        self.character_stats = DEFAULT_CHARACTER_STATS.copy()
+        self.hidden_stats = DEFAULT_HIDDEN_STATS.copy()
         self.choice_count = 0
-        self.choice_history: List[str] = []
+        self.choice_history: Deque[str] = deque(maxlen=_CHOICE_HISTORY_LIMIT)
         self.event_flags: List[str] = []
+        self._critical_flag_count = 0  # Flags in event_flags that are CRITICAL_EVENTS
         self.current_narrative = ""
+        self._narrative_lower = ""
         self.instability_level = 0
         self.last_danger_level = 'none'  # Track for consequence feedback
+        self.last_damage_dealt = 0
         
         # Event tracking for forced progression
         self.event_timer = 0  # Forces event every 2-3 choices
-        self.discoveries: List[str] = []  # Track what's been revealed
+        self.discoveries: Deque[str] = deque(maxlen=_DISCOVERY_LIMIT)  # Track what's been revealed
         self.active_threats: List[str] = []  # Ongoing dangers
+        self._active_threats_set: Set[str] = set()  # Membership for active_threats
         self.transformations: List[str] = []  # Body/reality changes
         
         # Horror concept tracking for variety
         self.horror_concepts_used: List[str] = []  # Track tropes to avoid repetition
+        self._horror_concepts_set: Set[str] = set()  # Membership for horror_concepts_used
         
         # Narrative momentum tracking for faster pacing
         self.momentum_level = 0  # Tracks narrative escalation
         self.climax_triggered = False
         self.must_end_soon = False  # Flag for forcing conclusion
+        
+        # Per-engine RNG for danger rolls, damage and feedback picks
+        self._rng = random.Random()
+        
+        # get_context() result, reused until the state changes
+        self._context_cache: Optional[Dict] = None
+        self._context_dirty = True
+    
+    def reset(self):
+        """Return to a fresh-game state, clearing the existing containers in place."""
+        self.character_stats.clear()
+        self.character_stats.update(DEFAULT_CHARACTER_STATS)
+        self.hidden_stats.clear()
+        self.hidden_stats.update(DEFAULT_HIDDEN_STATS)
+        self.choice_count = 0
+        self.choice_history.clear()
+        self.event_flags.clear()
+        self._critical_flag_count = 0
+        self.current_narrative = ""
+        self._narrative_lower = ""
+        self.instability_level = 0
+        self.last_danger_level = 'none'
+        self.last_damage_dealt = 0
+        
+        self.event_timer = 0
+        self.discoveries.clear()
+        self.active_threats.clear()
+        self._active_threats_set.clear()
+        self.transformations.clear()
+        
+        self.horror_concepts_used.clear()
+        self._horror_concepts_set.clear()
+        
+        self.momentum_level = 0
+        self.climax_triggered = False
+        self.must_end_soon = False
+        
+        self._context_cache = None
+        self._context_dirty = True
     
     def process_choice(self, choice_text: str, choice_index: int) -> Dict:
         """Process a player choice and modify stats."""
         self.choice_count += 1
         self.choice_history.append(choice_text)
+        self._context_dirty = True
         
         # Store last danger level for feedback
         self.last_danger_level = 'none'
@@ -50,8 +220,8 @@ class StoryEngine:
         # Increment event timer for forced progression
         self.event_timer += 1
         
-        # Modify stats based on choice characteristics
-        self._apply_choice_effects(choice_text, choice_index)
+        # Modify stats based on choice characteristics (lowercased once per turn)
+        self._apply_choice_effects(choice_text, choice_text.lower(), choice_index)
         
         # Update instability level
         self._update_instability()
@@ -59,16 +229,18 @@ class StoryEngine:
         # Return current context for AI generation
         return self.get_context()
     
-    def _apply_choice_effects(self, choice_text: str, choice_index: int):
+    def _apply_choice_effects(self, choice_text: str, text_lower: str, choice_index: int):
         """Apply stat modifications based on choice content - DISABLED in favor of AI consequences."""
-        text_lower = choice_text.lower()
-        
         # LEGACY SYSTEM DISABLED: All consequences now come from AI
         # This prevents double-dipping (AI consequences + keyword consequences)
         # The old system was causing instant death by applying 20-30 damage on top of AI damage
         
-        # Still track danger level for trap detection (instant death traps)
-        danger_level = self._assess_choice_danger(text_lower)
+        # Still track danger level for trap detection (instant death traps).
+        # Only instant death matters here, so most choices skip the tier scan entirely.
+        if _INSTANT_DEATH_RE.search(text_lower):
+            danger_level = self._assess_choice_danger(text_lower)
+        else:
+            danger_level = 'none'
         
         # Only apply instant death traps - everything else comes from AI
         if danger_level == 'instant_death':
@@ -83,21 +255,24 @@ class StoryEngine:
     
     def _modify_hidden_stat(self, stat: str, change: int):
         """Modify a hidden stat (clamped 0-10)."""
-        if stat in self.hidden_stats:
-            self.hidden_stats[stat] = max(0, min(10, self.hidden_stats[stat] + change))
+        hs = self.hidden_stats
+        if stat in hs:
+            # Conditional clamps: no max()/min() calls on the stat hot path
+            value = hs[stat] + change
+            hs[stat] = 0 if value < 0 else 10 if value > 10 else value
     
     def _modify_character_stat(self, stat: str, change: int):
         """Modify a character stat."""
-        if stat in self.character_stats:
+        cs = self.character_stats
+        if stat in cs:
+            value = cs[stat] + change
             if stat == 'health':
                 # Health clamped to 0-max_health
-                self.character_stats[stat] = max(
-                    0, 
-                    min(self.character_stats['max_health'], self.character_stats[stat] + change)
-                )
+                max_health = cs['max_health']
+                cs[stat] = 0 if value < 0 else max_health if value > max_health else value
             else:
                 # Other stats clamped to 1-10
-                self.character_stats[stat] = max(1, min(10, self.character_stats[stat] + change))
+                cs[stat] = 1 if value < 1 else 10 if value > 10 else value
     
     def _update_instability(self):
         """Update instability level based on progression."""
@@ -111,35 +286,44 @@ class StoryEngine:
         if self.hidden_stats['trust'] < 2:
             self.instability_level += 1
         
-        # Event-based spikes
-        for event in self.event_flags:
-            if event in CRITICAL_EVENTS:
-                self.instability_level += 1
+        # Event-based spikes (counted as flags are added)
+        self.instability_level += self._critical_flag_count
     
     def trigger_event(self, event_name: str):
         """Trigger a critical event that affects instability."""
         if event_name not in self.event_flags:
             self.event_flags.append(event_name)
+            if event_name in _CRITICAL_EVENTS:
+                self._critical_flag_count += 1
             self._update_instability()
+            self._context_dirty = True
     
     def get_visual_intensity(self) -> str:
         """Get current visual effect intensity level."""
-        if self.choice_count >= PROGRESSION_CONFIG['reality_collapse_at']:
-            return 'collapsed'
-        elif self.choice_count >= PROGRESSION_CONFIG['major_breakdown_at']:
-            return 'breaking'
-        elif self.choice_count >= PROGRESSION_CONFIG['minor_breakdown_at']:
-            return 'disturbed'
-        elif self.instability_level > 0:
+        idx = bisect_right(_INTENSITY_THRESHOLDS, self.choice_count)
+        if idx == 0 and self.instability_level > 0:
             return 'unsettled'
-        return 'stable'
+        return _INTENSITY_LEVELS[idx]
     
     def get_context(self) -> Dict:
-        """Get current context for AI generation."""
+        """
+        Get current context for AI generation.
+        Built once per state change; each caller gets its own shallow copy.
+        """
         # Update momentum before returning context
+        momentum_before = (self.momentum_level, self.must_end_soon)
         self.update_momentum()
         
-        return {
+        if (
+            not self._context_dirty
+            and self._context_cache is not None
+            and (self.momentum_level, self.must_end_soon) == momentum_before
+        ):
+            return dict(self._context_cache)
+        
+        self._context_dirty = False
+        # List fields go out as tuple snapshots so readers can share them safely
+        self._context_cache = {
             'character_stats': self.character_stats.copy(),
             'hidden_stats': self.hidden_stats.copy(),
             'choice_count': self.choice_count,
@@ -147,24 +331,27 @@ class StoryEngine:
             'recent_narrative': self.current_narrative,
             'instability_level': self.instability_level,
             'visual_intensity': self.get_visual_intensity(),
-            'event_flags': self.event_flags.copy(),
+            'event_flags': tuple(self.event_flags),
             # Event tracking for forced progression
             'event_urgency': self.event_timer >= 2,  # Signal AI to make something happen
-            'recent_discoveries': self.discoveries[-3:] if self.discoveries else [],
-            'active_threats': self.active_threats.copy(),
-            'transformations': self.transformations.copy(),
+            'recent_discoveries': list(self.discoveries)[-3:],
+            'active_threats': tuple(self.active_threats),
+            'transformations': tuple(self.transformations),
             # Horror concept diversity tracking
-            'horror_concepts_used': self.horror_concepts_used.copy(),
+            'horror_concepts_used': tuple(self.horror_concepts_used),
             'concept_diversity_prompt': self.get_concept_diversity_prompt(),
             # Narrative momentum for faster pacing
             'momentum_level': self.momentum_level,
             'momentum_prompt': self.get_momentum_prompt_modifier(),
             'must_end_soon': self.must_end_soon,
         }
+        return dict(self._context_cache)
     
     def set_narrative(self, narrative: str):
         """Update current narrative text."""
         self.current_narrative = narrative
+        self._narrative_lower = narrative.lower()
+        self._context_dirty = True
     
     def apply_ai_consequences(self, consequences: Dict[str, int]):
         """
@@ -173,6 +360,10 @@ class StoryEngine:
         """
         from engine.debug import debug_log
         
+        self._context_dirty = True
+        cs = self.character_stats
+        hs = self.hidden_stats
+        
         # DEBUG OUTPUT
         debug_log(f"\n[DEBUG] Turn {self.choice_count}: Applying consequences: {consequences}")
         
@@ -201,8 +392,11 @@ class StoryEngine:
                 health_change = max(health_change, -25)
                 health_change = int(health_change * protection_multiplier)
             
-            debug_log(f"[DEBUG] Health: {original_change} -> capped/protected -> {health_change} (current: {self.character_stats['health']})")
-            self._modify_character_stat('health', health_change)
+            debug_log(f"[DEBUG] Health: {original_change} -> capped/protected -> {health_change} (current: {cs['health']})")
+            # Inline clamps: the stat keys are fixed, so skip _modify_*_stat's lookups
+            value = cs['health'] + health_change
+            max_health = cs['max_health']
+            cs['health'] = 0 if value < 0 else max_health if value > max_health else value
             # Track damage for feedback
             if health_change < 0:
                 self.last_damage_dealt = abs(health_change)
@@ -229,19 +423,23 @@ class StoryEngine:
                 sanity_change = max(sanity_change, -4)
                 sanity_change = int(sanity_change * protection_multiplier)
             
-            debug_log(f"[DEBUG] Sanity: {original_sanity} -> capped/protected -> {sanity_change} (current: {self.hidden_stats['sanity']})")
-            self._modify_hidden_stat('sanity', sanity_change)
+            debug_log(f"[DEBUG] Sanity: {original_sanity} -> capped/protected -> {sanity_change} (current: {hs['sanity']})")
+            value = hs['sanity'] + sanity_change
+            hs['sanity'] = 0 if value < 0 else 10 if value > 10 else value
         
         # Apply courage change with protection
         if 'courage' in consequences and consequences['courage'] != 0:
-            self._modify_hidden_stat('courage', consequences['courage'])
+            value = hs['courage'] + consequences['courage']
+            hs['courage'] = 0 if value < 0 else 10 if value > 10 else value
     
     def record_event(self, event_type: str, description: str):
         """Record an event occurrence and reset timer."""
+        self._context_dirty = True
         if event_type == "discovery":
             self.discoveries.append(description)
         elif event_type == "threat":
-            if description not in self.active_threats:
+            if description not in self._active_threats_set:
+                self._active_threats_set.add(description)
                 self.active_threats.append(description)
         elif event_type == "transformation":
             self.transformations.append(description)
@@ -251,49 +449,30 @@ class StoryEngine:
     
     def detect_horror_concepts(self, narrative: str):
         """Detect common horror tropes in narrative to track variety."""
-        concepts = {
-            'doppelganger': ['doppelganger', 'double', 'twin', 'copy', 'duplicate', 'reflection that moves', 'other you', 'another you', 'identical'],
-            'mirror': ['mirror', 'reflection', 'glass'],
-            'pursuit': ['chasing', 'following', 'pursuing', 'hunting you'],
-            'transformation': ['changing', 'transforming', 'morphing', 'becoming'],
-            'voices': ['voices', 'whispers', 'speaking', 'calling'],
-            'darkness': ['darkness', 'shadow', 'dark', 'blackness'],
-            'eyes': ['eyes watching', 'staring', 'gaze', 'observing'],
-            'doors': ['door', 'doorway', 'entrance', 'threshold'],
-            'time_loop': ['again', 'repeat', 'before', 'déjà vu', 'happened before'],
-            'body_horror': ['flesh', 'skin', 'bones', 'organs', 'blood'],
-            'isolation': ['alone', 'empty', 'abandoned', 'no one'],
-            'fragmentation': ['pieces', 'fragments', 'breaking apart', 'dissolving'],
-        }
-        
-        narrative_lower = narrative.lower()
-        for concept, keywords in concepts.items():
-            if any(keyword in narrative_lower for keyword in keywords):
-                if concept not in self.horror_concepts_used:
-                    self.horror_concepts_used.append(concept)
+        # The narrative is usually the one set_narrative() already lowercased
+        if narrative is self.current_narrative:
+            narrative_lower = self._narrative_lower
+        else:
+            narrative_lower = narrative.lower()
+        found = set()
+        for match in _HORROR_RE.finditer(narrative_lower):
+            found |= _HORROR_HITS[match.group(1)]
+        
+        for concept in _HORROR_CONCEPTS:
+            if concept in found and concept not in self._horror_concepts_set:
+                self._horror_concepts_set.add(concept)
+                self.horror_concepts_used.append(concept)
+                self._context_dirty = True
     
     def get_concept_diversity_prompt(self) -> str:
         """Generate prompt section encouraging conceptual variety."""
         if not self.horror_concepts_used:
             return ""
         
-        # Build positive steering (what to explore) rather than negative (what to avoid)
-        unused_concepts = [
-            'geometric impossibility', 'mathematical horror', 'sensory confusion',
-            'bureaucratic nightmare', 'linguistic breakdown', 'archaeological dread',
-            'chemical transformation', 'quantum uncertainty', 'biological invasion',
-            'architectural wrongness', 'temporal paradox', 'gravity distortion',
-            'sound-based horror', 'tactile wrongness', 'olfactory nightmare',
-            'pressure changes', 'temperature extremes', 'spatial compression',
-            'crowd horror', 'absence of expected', 'too many of something',
-            'scale distortion', 'texture horror', 'pattern recognition failure'
-        ]
-        
         # If we've used many concepts, suggest fresh angles
         if len(self.horror_concepts_used) >= 3:
-            suggestions = [c for c in unused_concepts if random.random() < 0.4][:3]
-            if suggestions:
-                return f"\n\nFRESH ANGLES TO EXPLORE: Consider incorporating: {', '.join(suggestions)}\nALREADY EXPLORED THIS SESSION: {', '.join(self.horror_concepts_used[-5:])} - find new ways to unsettle"
+            suggestions = self._rng.sample(_FRESH_CONCEPTS, 3)
+            return f"\n\nFRESH ANGLES TO EXPLORE: Consider incorporating: {', '.join(suggestions)}\nALREADY EXPLORED THIS SESSION: {', '.join(self.horror_concepts_used[-5:])} - find new ways to unsettle"
         
         return ""
     
@@ -330,45 +509,22 @@ class StoryEngine:
     
     def detect_trap_choice(self, choice_text: str) -> bool:
         """Detect if player chose an obvious trap/bad choice (classic CYOA mechanic)."""
-        trap_indicators = [
-            'ignore warning', 'ignore the warning', 'ignore all',
-            'obviously', 'despite', 'anyway', 'against',
-            'clearly dangerous', 'strange liquid', 'unknown substance',
-            'trust the', 'believe the', 'follow the monster',
-            'touch the', 'grab the', 'drink the', 'eat the',
-            'step into the trap', 'walk into',
-        ]
-        
-        text_lower = choice_text.lower()
-        
-        # Check for trap indicators
-        for indicator in trap_indicators:
-            if indicator in text_lower:
-                return True
-        
-        # Check for parenthetical warnings being ignored
-        if '(' in choice_text and ')' in choice_text:
-            # Extract parenthetical content
-            paren_content = choice_text[choice_text.find('(')+1:choice_text.find(')')].lower()
-            warning_words = ['poison', 'danger', 'trap', 'dead', 'death', 'hurt', 'bad', 'kill', 'fatal']
-            if any(word in paren_content for word in warning_words):
-                return True
-        
-        return False
+        return _TRAP_RE.search(choice_text) is not None
     
     def apply_trap_consequences(self):
         """Apply severe consequences for choosing obvious trap choices."""
         # Use AI consequence system with protection (but heavier than normal)
         trap_consequences = {
-            'health': random.randint(-30, -20),  # Heavy but not instant death
-            'sanity': random.randint(-3, -1),
-            'courage': random.randint(-2, -1)
+            'health': self._rng.randint(-30, -20),  # Heavy but not instant death
+            'sanity': self._rng.randint(-3, -1),
+            'courage': self._rng.randint(-2, -1)
         }
         # This will apply protection multiplier based on turn count
         self.apply_ai_consequences(trap_consequences)
         
         # Set flag for forced bad outcome
         self.event_flags.append('TRAP_TRIGGERED')
+        self._context_dirty = True
         self.must_end_soon = True  # Force ending soon after trap
         self.momentum_level += 5  # Jump momentum
     
@@ -377,28 +533,19 @@ class StoryEngine:
         Assess danger level of a choice.
         Returns: 'none', 'low', 'medium', 'high', 'extreme'
         """
-        # Keywords indicating danger levels
-        extreme_keywords = ['attack', 'charge', 'confront directly', 'fight']
-        high_keywords = ['investigate', 'touch', 'open', 'enter', 'confront']
-        medium_keywords = ['explore', 'examine closely', 'follow', 'pursue']
-        low_keywords = ['look', 'listen', 'observe', 'cautious']
-        
         # Instant death trap check (1-2% for obvious traps)
-        if any(word in choice_text for word in ['obvious trap', 'clearly dangerous', 'suicide']):
-            if random.random() < 0.015:  # 1.5% chance
+        if _INSTANT_DEATH_RE.search(choice_text):
+            if self._rng.random() < 0.015:  # 1.5% chance
                 return 'instant_death'
         
-        # Check keywords
-        if any(word in choice_text for word in extreme_keywords):
-            return 'extreme'
-        elif any(word in choice_text for word in high_keywords):
-            return 'high'
-        elif any(word in choice_text for word in medium_keywords):
-            return 'medium'
-        elif any(word in choice_text for word in low_keywords):
-            return 'low'
-        
-        return 'none'
+        # Tokenize once and keep the most severe tier any keyword hits
+        danger_get = _DANGER_MAP.get
+        best = max((danger_get(t, 0) for t in _WORD_RE.findall(choice_text)), default=0)
+        for phrase, tier in _DANGER_PHRASES:
+            if tier > best and phrase in choice_text:
+                best = tier
+        
+        return _TIER_NAMES[best]
     
     def _apply_consequences(self, danger_level: str, choice_text: str):
         """Apply health and sanity consequences based on danger."""
@@ -416,40 +563,19 @@ class StoryEngine:
             self.trigger_event('instant_death_trap')
             return
         
-        elif danger_level == 'extreme':
-            # 20-30 health loss
-            damage = random.randint(20, 30)
-            damage = int(damage * progression_multiplier)
-            self._modify_character_stat('health', -damage)
-            self._modify_hidden_stat('sanity', random.randint(-2, -1))
-            self.last_damage_dealt = damage  # Track for feedback
-        
-        elif danger_level == 'high':
-            # 15-25 health loss
-            damage = random.randint(15, 25)
-            damage = int(damage * progression_multiplier)
-            self._modify_character_stat('health', -damage)
-            self._modify_hidden_stat('sanity', random.randint(-1, 0))
-            self.last_damage_dealt = damage  # Track for feedback
-        
-        elif danger_level == 'medium':
-            # 10-20 health loss
-            damage = random.randint(10, 20)
-            damage = int(damage * progression_multiplier)
-            self._modify_character_stat('health', -damage)
-            self.last_damage_dealt = damage  # Track for feedback
-        
-        elif danger_level == 'low':
-            # 5-10 health loss
-            damage = random.randint(5, 10)
-            if self.choice_count > 10:
-                damage = int(damage * progression_multiplier)
+        # Table-driven tiers: roll damage, then sanity where the tier has a range
+        params = _DANGER_TABLE.get(danger_level)
+        if params:
+            dmg_lo, dmg_hi, sanity_range = params
+            damage = int(self._rng.randint(dmg_lo, dmg_hi) * progression_multiplier)
             self._modify_character_stat('health', -damage)
+            if sanity_range:
+                self._modify_hidden_stat('sanity', self._rng.randint(*sanity_range))
             self.last_damage_dealt = damage  # Track for feedback
         
         # Random sanity drain (paranoia, witnessing horror)
         if 'horror' in choice_text or 'witness' in choice_text:
-            self._modify_hidden_stat('sanity', random.randint(-2, -1))
+            self._modify_hidden_stat('sanity', self._rng.randint(-2, -1))
         
         # Paranoid choices reduce sanity
         if 'paranoid' in choice_text or 'suspicious' in choice_text:
@@ -461,36 +587,13 @@ class StoryEngine:
         Only shows feedback when actual damage was dealt from a dangerous choice.
         """
         # Don't show feedback if no danger or no actual damage was dealt
-        if danger_level == 'none' or not hasattr(self, 'last_damage_dealt') or self.last_damage_dealt == 0:
+        if danger_level == 'none' or self.last_damage_dealt == 0:
             return None
         
         # Only show feedback if there was actual damage from the choice
-        feedbacks = {
-            'extreme': [
-                "(that was unwise)",
-                "(brave, but stupid)",
-                "You pay the price.",
-                "(ouch)",
-            ],
-            'high': [
-                "(that cost you)",
-                "Your health suffers.",
-                "(was it worth it?)",
-                "Pain follows."
-            ],
-            'medium': [
-                "(careful...)",
-                "That hurt.",
-                "(consequences)",
-            ],
-            'low': [
-                "(you felt that)",
-                "A small price.",
-            ]
-        }
-        
-        if danger_level in feedbacks and self.last_damage_dealt > 0:
-            return random.choice(feedbacks[danger_level])
+        group = _FEEDBACKS.get(danger_level)
+        if group:
+            return self._rng.choice(group)
         
         return None
     
@@ -511,13 +614,15 @@ class StoryEngine:
         return False, None
     
     def get_state_summary(self) -> Dict:
-        """Get complete state for ghost memory saving."""
+        """
+        Get complete state for ghost memory saving.
+        Read-only views/snapshots, so callers can't mutate the live engine.
+        """
         return {
-            'character_stats': self.character_stats,
-            'hidden_stats': self.hidden_stats,
+            'character_stats': MappingProxyType(self.character_stats),
+            'hidden_stats': MappingProxyType(self.hidden_stats),
             'choice_count': self.choice_count,
-            'choice_history': self.choice_history,
-            'event_flags': self.event_flags,
+            'choice_history': tuple(self.choice_history),
+            'event_flags': tuple(self.event_flags),
             'instability_level': self.instability_level
         }
-
@@ -1,17 +1,363 @@
 """Typography and visual effects system - experimental terminal horror."""
 
+import math
 import random
 import re
 import time
+from functools import lru_cache
 from typing import List, Optional
 from config.settings import VISUAL_INTENSITY
 
 
+# ===== Message and art pools (built once, shared by every engine) =====
+
+_FAKE_FOOTNOTES = (
+    "[1] There is no footnote 1.",
+    "[*] This note leads nowhere.",
+    "[?] You shouldn't read this.",
+    "[†] [MISSING]",
+)
+
+_TERMINAL_GLITCHES = (
+    "^C^C^C",
+    "[CTRL+Z]",
+    ">>> ",
+    "$ ",
+    "ERROR: Segmentation fault",
+    "zsh: command not found:",
+    "Connection to localhost closed.",
+    "-bash: syntax error",
+    "kill -9 $$",
+)
+
+_CURSOR_ARTIFACTS = (
+    "_",
+    "▌",
+    "█",
+    "|",
+    "...",
+)
+
+_PERMISSION_ERRORS = (
+    "Permission denied: you are not meant to read this",
+    "Access denied: file corrupted",
+    "Error 403: Narrative forbidden",
+    "rm: cannot remove 'reality': Permission denied",
+)
+
+_COMPUTER_HORROR_MESSAGES = (
+    "(your terminal is ${COLUMNS} characters wide)",
+    "(you've been sitting here for a while)",
+    "(your keyboard has fingerprints on the W, A, S, D keys)",
+    "(the fan on your computer just got louder)",
+    "(did your cursor just move on its own?)",
+    "(check your running processes)",
+    "(close this window and walk away)",
+    "(ps aux | grep fear)",
+    "(your screen is very bright in this dark room)",
+    "(someone can see your screen from behind you)",
+    "(cat /dev/urandom)",
+    "(this process is using 99% of your CPU)",
+    "(your battery: LOW)",
+)
+
+_LOADING_MESSAGES = (
+    "[LOADING...]",
+    "[REMEMBERING...]",
+    "[FORGETTING...]",
+    "[RECONSTRUCTING...]",
+)
+
+_LOADING_GLITCHED = (
+    "[C̴O̷N̶N̸E̷C̴T̸I̷N̶G̸...]",
+    "[PLEASE WAIT]",
+    "[DO NOT WAIT]",
+    "[T̷I̶M̸E̷ ̶E̸R̷R̶O̷R̴]",
+)
+
+_CREEPY_ARTS = {
+    "eyes": """
+        👁️        👁️
+            ‿
+            """,
+    "watching": """
+    👁️ 👁️ 👁️ 👁️ 👁️
+      👁️ 👁️ 👁️ 👁️
+        👁️ 👁️ 👁️
+            """,
+    "eyes_detailed": """
+      ╱─────╲  ╱─────╲
+     │  ◉◉  ││  ◉◉  │
+      ╲_____╱  ╲_____╱
+        │        │
+            """,
+    "many_eyes": """
+    (◉) (◉) (◉)
+      (◉) (◉)
+    (◉) (◉) (◉)
+       watching
+            """,
+    "static": """
+    ▓▒░░▒▓█▓▒░░▒▓
+    ░▒▓█▓▒░░▒▓█▓▒
+    ▓▒░░▒▓█▓▒░░▒▓
+            """,
+    "corruption": """
+    ◢◤◢◤◢◤◢◤◢◤
+    ◥◣◥◣◥◣◥◣◥◣
+    ◢◤◢◤◢◤◢◤◢◤
+            """,
+    "spiral": """
+        ╭─────╮
+        │  ◉  │
+        ╰─────╯
+            """,
+    "glitch": """
+    █▓▒░T̴H̷I̶N̸K̷█▒▓░
+    ░▒▓█E̴R̷R̶O̸R̷░▓▒█
+    ▓▒░█N̴O̷W̶░▒▓█▓
+            """,
+    "void": """
+    ░░░░░░░░░░░░░░
+    ░░░░░ ◉ ░░░░░
+    ░░░░░░░░░░░░░░
+            """,
+    "mouth": """
+        ╱▔▔▔▔▔╲
+        ▏  👄  ▕
+        ╲_____╱
+            """,
+    "mouth_teeth": """
+      ╱▔▔▔▔▔▔▔╲
+     │ ▲▼▲▼▲▼▲ │
+     │ ▼▲▼▲▼▲▼ │
+      ╲________╱
+            """,
+    "hands": """
+    🖐️         🖐️
+      🖐️     🖐️
+         🖐️
+            """,
+    "reaching_hand": """
+         ╱│╲
+        ╱ │ ╲
+       │  │  │
+       │  │  │
+      ╱│ ╱│╲ │╲
+     ╱ │╱ │ ╲│ ╲
+    reaching...
+            """,
+    "twisted_hand": """
+      ╱╲  ╱╲  ╱╲
+     ╱  ╲╱  ╲╱  ╲
+    │ too many  │
+     ╲ fingers ╱
+      ╲╲╲│╱╱╱
+            """,
+    "skeletal": """
+        ☠
+       ╱│╲
+      ╱ │ ╲
+        │
+       ╱ ╲
+      ╱   ╲
+            """,
+    "skull": """
+      ┌─────┐
+      │ ◉ ◉ │
+      │  ▼  │
+      │ ══  │
+      └─────┘
+            """,
+    "death_figure": """
+        ___
+       ╱   ╲
+      │ ☠ ☠ │
+       ╲___╱
+       ╱│││╲
+      ╱ │││ ╲
+            """,
+    "binary": """
+    01001000 01000101
+    01001100 01010000
+    00100001 00100001
+            """,
+    "flesh_mass": """
+      ╱╲╱╲╱╲
+     ╱▓▒░▒▓╲
+    │ pulsing │
+     ╲▒▓░▓▒╱
+      ╲╱╲╱╲╱
+            """,
+    "tendrils": """
+       ╱  │  ╲
+      ╱   │   ╲
+     ╱   ╱│╲   ╲
+    │   ╱ │ ╲   │
+     ╲ ╱  │  ╲ ╱
+      writhing
+            """,
+    "geometric_horror": """
+      ╱╲
+     ╱  ╲
+    ╱ ╱╲ ╲
+    ╲ ╲╱ ╱
+     ╲  ╱
+      ╲╱
+    impossible
+            """,
+    "doorway": """
+    ┌─────────┐
+    │         │
+    │    ?    │
+    │         │
+    │  ╱───╲  │
+    └──└───┘──┘
+            """,
+    "machine": """
+    ╔═══╦═══╗
+    ║ ◉ ║ ◉ ║
+    ╠═══╬═══╣
+    ║▓▒░│░▒▓║
+    ╚═══╩═══╝
+    computing
+            """,
+    "split_face": """
+      ╱◉ │ ◉╲
+     │   │   │
+     │ ══│══ │
+      ╲  │  ╱
+       ╲_│_╱
+            """,
+    "melting": """
+      ╱▔▔▔╲
+     │ ◉ ◉ │
+     │ drip │
+      ╲╲│╱╱
+       ▼▼▼
+            """,
+    "veins": """
+    ╱─╲  ╱─╲
+    │ ╱──╲ │
+    ╲─╲  ╱─╱
+      ╲──╱
+    pulsing
+            """,
+}
+# Drop the source-indent spaces trailing each art's last newline; the art's own
+# left margin is kept since it is printed as-is
+_CREEPY_ARTS = {name: art.rstrip(' ') for name, art in _CREEPY_ARTS.items()}
+_CREEPY_ART_VALUES = tuple(_CREEPY_ARTS.values())  # For the random pick
+_VOID_ART = _CREEPY_ARTS["void"]  # Fallback for unknown names
+
+_META_TRICKS = (
+    lambda t: t + " (wait, did I say that out loud?)",
+    lambda t: t.replace("you", "you (yes, you reading this)"),
+    lambda t: "[RECORDING] " + t,
+    lambda t: t + " [REDACTED]",
+)
+
+# create_spiral_text indents: out to 6 and back (abs(indent) bounces past 5)
+_SPIRAL_INDENTS = (0, 1, 2, 3, 4, 5, 6, 5, 4, 3)
+
+# Splits text into word, whitespace, word, ... so effects can rejoin it unchanged
+_WHITESPACE_SPLIT_RE = re.compile(r'(\s+)')
+
+
+def _geometric_hits(n: int, p: float, rand=random.random):
+    """
+    Yield the indices in range(n) that each fire with probability p.
+    Jumps straight to the next hit, so it costs one random draw per hit, not per index.
+    """
+    if p <= 0:
+        return
+    if p >= 1:
+        yield from range(n)
+        return
+    
+    log_miss = math.log1p(-p)
+    i = -1
+    while True:
+        # Misses before the next hit are geometric; 1 - random() keeps log() off zero
+        i += 1 + int(math.log(1.0 - rand()) / log_miss)
+        if i >= n:
+            return
+        yield i
+
+
+@lru_cache(maxsize=64)
+def _strike(word: str) -> str:
+    """Strike through each character of a word with a combining long stroke."""
+    return '\u0336'.join(word) + '\u0336' if word else ''
+
+
+# ===== Deterministic layouts (pure functions of the text, so cached) =====
+
+@lru_cache(maxsize=256)
+def _spiral_lines(text: str) -> tuple:
+    """Lines of the spiral layout, as a tuple so the cached value can't be mutated."""
+    words = text.split()
+    if len(words) < 3:
+        return (text,)
+    
+    # Limit to 10 words
+    return tuple(
+        word.rjust(len(word) + indent) for word, indent in zip(words[:10], _SPIRAL_INDENTS)
+    )
+
+
+@lru_cache(maxsize=256)
+def _diagonal_text(text: str) -> str:
+    words = text.split()[:8]
+    lines = []
+    for i, word in enumerate(words):
+        lines.append(" " * i + word)
+    return "\n".join(lines)
+
+
+@lru_cache(maxsize=256)
+def _centered_collapse(text: str) -> str:
+    words = text.split()
+    if len(words) < 5:
+        return text
+    
+    mid = len(words) // 2
+    lines = []
+    
+    for i in range(mid):
+        indent = mid - i
+        lines.append(" " * indent + words[i])
+    
+    lines.append(words[mid])  # Center word
+    
+    for i in range(mid + 1, len(words)):
+        indent = i - mid
+        lines.append(" " * indent + words[i])
+    
+    return "\n".join(lines)
+
+
+@lru_cache(maxsize=256)
+def _box_text(text: str) -> str:
+    lines = text.split('\n')  # Always at least one line
+    max_len = min(max(map(len, lines)), 60)
+    
+    border = "─" * (max_len + 2)
+    box = [f"┌{border}┐"]
+    box.extend([f"│ {line[:max_len]:<{max_len}} │" for line in lines[:5]])  # Limit lines
+    box.append(f"└{border}┘")
+    
+    return "\n".join(box)
+
+
 class TypographyEngine:
     """Handles experimental text layout and visual effects."""
     
     # Unicode characters for corruption effects
-    CORRUPTION_CHARS = ['̴', '̷', '̶', '̸', '̵', '̢', '̡', '̧', '̨', '̛']
+    CORRUPTION_CHARS = ('̴', '̷', '̶', '̸', '̵', '̢', '̡', '̧', '̨', '̛')
+    # Block glyph pools for fading (light to dark) and static noise
+    _FADE_CHARS = ('░', '▒', '▓', '█')
+    _STATIC_CHARS = ('▓', '▒', '░', '█')
     GLITCH_REPLACEMENTS = {
         'a': ['@', 'a', '4'],
         'e': ['3', 'e', 'é'],
@@ -20,10 +366,32 @@ class TypographyEngine:
         's': ['$', '5', 's'],
         't': ['+', 't', '7'],
     }
+    # Both cases of each glitchable letter -> its replacements, so the per-char
+    # hot loop is one dict probe with no .lower()
+    _GLITCH_TABLE = {
+        c: tuple(v) for k, v in GLITCH_REPLACEMENTS.items() for c in (k, k.upper())
+    }
+    # Geometric gap with p=0.02 between meta tricks on stable text
+    _META_TRICK_RATE = -math.log(0.98)
+    # Narrator corrections: word -> its struck-through form plus the "real" word
+    _CORRECTION_REPLACEMENTS = {
+        old: _strike(old) + ' ' + new
+        for old, new in (
+            ("safe", "trapped"),
+            ("door", "mouth"),
+            ("hallway", "throat"),
+            ("room", "stomach"),
+            ("exit", "entrance"),
+            ("forward", "backward"),
+        )
+    }
+    _CORRECTION_RE = re.compile(r'\b(' + '|'.join(_CORRECTION_REPLACEMENTS) + r')\b', re.IGNORECASE)
     
     def __init__(self):
         """Initialize typography engine."""
         self.intensity = 0.0
+        self._rng = random.Random()  # Own RNG for the per-character effect loops
+        self._next_meta_trick = self._roll_next_meta_trick()
     
     def set_intensity(self, intensity_level: str):
         """Set visual intensity based on game state."""
@@ -34,53 +402,48 @@ class TypographyEngine:
         intensity = intensity_override if intensity_override is not None else self.intensity
         
         if intensity <= 0.1:
-            # Even when stable, occasionally mess with the player
-            if random.random() < 0.02:  # 2% chance
+            # Even when stable, occasionally mess with the player (2% of calls,
+            # as a countdown so the common case draws no random number)
+            self._next_meta_trick -= 1
+            if self._next_meta_trick <= 0:
+                self._next_meta_trick = self._roll_next_meta_trick()
                 return self._add_meta_trick(text)
             return text  # No effects when stable
         
         # Apply effects with increasing probability
-        effects = []
-        
-        if random.random() < intensity * 0.3:
+        if self._rng.random() < intensity * 0.3:
             text = self._add_spacing_glitches(text, intensity)
         
-        if random.random() < intensity * 0.4:
+        if self._rng.random() < intensity * 0.4:
             text = self._add_character_substitution(text, intensity)
         
-        if random.random() < intensity * 0.25:
+        if self._rng.random() < intensity * 0.25:
             text = self._add_repetition(text, intensity)
         
-        if intensity > 0.5 and random.random() < intensity * 0.2:
+        if intensity > 0.5 and self._rng.random() < intensity * 0.2:
             text = self._add_corruption(text, intensity)
         
         return text
     
     def _add_meta_trick(self, text: str) -> str:
         """Add subtle meta tricks even when stable."""
-        tricks = [
-            lambda t: t + " (wait, did I say that out loud?)",
-            lambda t: t.replace("you", "you (yes, you reading this)"),
-            lambda t: "[RECORDING] " + t,
-            lambda t: t + " [REDACTED]",
-        ]
-        return random.choice(tricks)(text)
+        return self._rng.choice(_META_TRICKS)(text)
+    
+    def _roll_next_meta_trick(self) -> int:
+        """Draw how many stable calls pass before the next meta trick."""
+        return int(self._rng.expovariate(self._META_TRICK_RATE)) + 1
     
     def _add_spacing_glitches(self, text: str, intensity: float) -> str:
         """Add random spacing issues."""
-        words = text.split()
-        result = []
+        parts = _WHITESPACE_SPLIT_RE.split(text)  # Words at even indices, original whitespace between
         
-        for word in words:
-            if random.random() < intensity * 0.3:
+        for i in _geometric_hits((len(parts) + 1) // 2, intensity * 0.3, self._rng.random):
+            word = parts[2 * i]
+            if len(word) > 3:
                 # Add extra spaces within word
-                chars = list(word)
-                spaced = ' '.join(chars) if len(chars) > 3 else word
-                result.append(spaced)
-            else:
-                result.append(word)
+                parts[2 * i] = ' '.join(word)
         
-        return ' '.join(result)
+        return ''.join(parts)
     
     def apply_glitch(self, text: str, intensity: float = 0.2) -> str:
         """Public method to apply glitch effect to text."""
@@ -88,80 +451,59 @@ class TypographyEngine:
     
     def _add_character_substitution(self, text: str, intensity: float) -> str:
         """Replace characters with glitch alternatives."""
-        result = []
-        
-        for char in text:
-            if char.lower() in self.GLITCH_REPLACEMENTS and random.random() < intensity * 0.15:
-                replacements = self.GLITCH_REPLACEMENTS[char.lower()]
-                result.append(random.choice(replacements))
-            else:
-                result.append(char)
-        
-        return ''.join(result)
+        table_get, choice = self._GLITCH_TABLE.get, self._rng.choice
+        
+        # Every position fires with the same probability and only glitchable letters
+        # change, so skip straight between hits and copy the untouched runs as slices
+        parts = []
+        start = 0
+        for pos in _geometric_hits(len(text), intensity * 0.15, self._rng.random):
+            replacements = table_get(text[pos])
+            if replacements is not None:
+                parts.append(text[start:pos])
+                parts.append(choice(replacements))
+                start = pos + 1
+        
+        if not parts:
+            return text
+        parts.append(text[start:])
+        return ''.join(parts)
     
     def _add_repetition(self, text: str, intensity: float) -> str:
         """Add word/syllable repetition."""
-        words = text.split()
-        result = []
+        parts = _WHITESPACE_SPLIT_RE.split(text)  # Words at even indices, original whitespace between
         
-        for word in words:
-            if random.random() < intensity * 0.2 and len(word) > 3:
+        for i in _geometric_hits((len(parts) + 1) // 2, intensity * 0.2, self._rng.random):
+            word = parts[2 * i]
+            if len(word) > 3:
                 # Repeat the word or stutter it
-                if random.random() < 0.5:
-                    result.append(f"{word} {word}")
+                if self._rng.random() < 0.5:
+                    parts[2 * i] = f"{word} {word}"
                 else:
                     # Stutter first syllable
-                    stutter = word[:2] + '-' + word
-                    result.append(stutter)
-            else:
-                result.append(word)
+                    parts[2 * i] = word[:2] + '-' + word
         
-        return ' '.join(result)
+        return ''.join(parts)
     
     def _add_corruption(self, text: str, intensity: float) -> str:
         """Add Unicode corruption marks."""
-        result = []
-        
-        for char in text:
-            result.append(char)
-            if char.isalpha() and random.random() < intensity * 0.1:
-                result.append(random.choice(self.CORRUPTION_CHARS))
-        
-        return ''.join(result)
-    
-    def create_scattered_text(self, text: str, width: int = 80) -> List[str]:
-        """Scatter text across multiple lines (panic effect)."""
-        words = text.split()
-        lines = [''] * 10
-        
-        for word in words:
-            line_idx = random.randint(0, len(lines) - 1)
-            pos = random.randint(0, max(0, width - len(word) - 1))
-            
-            # Create spacing
-            spaced_word = ' ' * pos + word
-            if len(lines[line_idx]) < pos:
-                lines[line_idx] = lines[line_idx].ljust(pos) + word
-            else:
-                lines[line_idx] += '  ' + word
-        
-        return [line for line in lines if line.strip()]
-    
-    def create_spiral_text(self, text: str, inward: bool = True) -> List[str]:
-        """Create spiraling text effect."""
-        words = text.split()
-        lines = []
-        indent = 0 if inward else 20
-        
-        for i, word in enumerate(words[:8]):  # Limit for readability
-            if inward:
-                indent = i * 2
-            else:
-                indent = max(0, 20 - i * 2)
-            
-            lines.append(' ' * indent + word)
-        
-        return lines
+        marks = self.CORRUPTION_CHARS
+        choice = self._rng.choice
+        pieces = []
+        last = 0
+        
+        # Any position may fire, but only letters take a mark: same per-letter odds,
+        # and untouched runs are copied as slices instead of char by char
+        for i in _geometric_hits(len(text), intensity * 0.1, self._rng.random):
+            if text[i].isalpha():
+                pieces.append(text[last:i + 1])
+                pieces.append(choice(marks))
+                last = i + 1
+        
+        if not pieces:
+            return text
+        pieces.append(text[last:])
+        return ''.join(pieces)
     
     def create_vertical_text(self, text: str) -> List[str]:
         """Create vertical text (falling/climbing effect)."""
@@ -176,8 +518,11 @@ class TypographyEngine:
     
     def add_strikethrough(self, text: str, word_to_strike: str) -> str:
         """Add strikethrough effect to specific words using Unicode."""
+        if word_to_strike not in text:
+            return text
+        
         # Use Unicode strikethrough combining character
-        struck = ''.join(c + '\u0336' for c in word_to_strike)
+        struck = _strike(word_to_strike)
         return text.replace(word_to_strike, struck)
     
     def add_marginalia(self, text: str, note: str, position: str = 'end') -> str:
@@ -201,121 +546,56 @@ class TypographyEngine:
     
     def create_fake_footnote(self) -> str:
         """Create fake footnote markers."""
-        footnotes = [
-            "[1] There is no footnote 1.",
-            "[*] This note leads nowhere.",
-            "[?] You shouldn't read this.",
-            "[†] [MISSING]"
-        ]
-        return random.choice(footnotes)
+        return self._rng.choice(_FAKE_FOOTNOTES)
     
     def process_narrator_corrections(self, text: str) -> str:
         """Process strikethrough corrections in text."""
-        # Look for patterns like "safe" that should be "trapped"
-        patterns = [
-            ("safe", "trapped"),
-            ("door", "mouth"),
-            ("hallway", "throat"),
-            ("room", "stomach"),
-            ("exit", "entrance"),
-            ("forward", "backward"),
-        ]
-        
-        if random.random() < self.intensity * 0.3:
-            old, new = random.choice(patterns)
-            if old in text.lower():
-                # Use Unicode strikethrough
-                struck_old = ''.join(c + '\u0336' for c in old)
-                text = re.sub(
-                    r'\b' + old + r'\b', 
-                    f"{struck_old} {new}", 
-                    text, 
-                    count=1,
-                    flags=re.IGNORECASE
-                )
+        # Look for patterns like "safe" that should be "trapped"; the first one found is corrected
+        if self._rng.random() < self.intensity * 0.3:
+            replacements = self._CORRECTION_REPLACEMENTS
+            # Use Unicode strikethrough
+            text = self._CORRECTION_RE.sub(lambda m: replacements[m.group(1).lower()], text, count=1)
         
         return text
     
     def get_loading_glitch(self) -> str:
         """Get a loading message that fits the aesthetic."""
-        messages = [
-            "[LOADING...]",
-            "[REMEMBERING...]",
-            "[FORGETTING...]",
-            "[RECONSTRUCTING...]",
-            "[C̴O̷N̶N̸E̷C̴T̸I̷N̶G̸...]",
-            "[PLEASE WAIT]",
-            "[DO NOT WAIT]",
-            "[T̷I̶M̸E̷ ̶E̸R̷R̶O̷R̴]",
-        ]
-        
         if self.intensity > 0.5:
-            return random.choice(messages[-4:])
-        return random.choice(messages[:4])
+            return self._rng.choice(_LOADING_GLITCHED)
+        return self._rng.choice(_LOADING_MESSAGES)
     
     # ===== EXPANDED VISUAL EFFECTS =====
     
-    def create_spiral_text(self, text: str, clockwise: bool = True) -> str:
-        """Create spiraling text effect."""
-        words = text.split()
-        if len(words) < 3:
-            return text
-        
-        spiral = []
-        indent = 0
-        direction = 1 if clockwise else -1
-        
-        for i, word in enumerate(words[:10]):  # Limit to 10 words
-            spiral.append(" " * abs(indent) + word)
-            indent += direction
-            if abs(indent) > 5:
-                direction *= -1
-        
-        return "\n".join(spiral)
+    def create_spiral_text(self, text: str, clockwise: bool = True, join_lines: bool = True):
+        """
+        Create spiraling text effect.
+        Returns one string, or the list of lines when join_lines is False.
+        """
+        # The indent swings out and back the same either direction
+        lines = _spiral_lines(text)
+        return "\n".join(lines) if join_lines else list(lines)
     
     def create_diagonal_text(self, text: str) -> str:
         """Create diagonal sliding text."""
-        words = text.split()[:8]
-        lines = []
-        for i, word in enumerate(words):
-            lines.append(" " * i + word)
-        return "\n".join(lines)
+        return _diagonal_text(text)
     
     def create_centered_collapse(self, text: str) -> str:
         """Text that collapses toward center."""
-        words = text.split()
-        if len(words) < 5:
-            return text
-        
-        mid = len(words) // 2
-        lines = []
-        
-        for i in range(mid):
-            indent = mid - i
-            lines.append(" " * indent + words[i])
-        
-        lines.append(words[mid])  # Center word
-        
-        for i in range(mid + 1, len(words)):
-            indent = i - mid
-            lines.append(" " * indent + words[i])
-        
-        return "\n".join(lines)
+        return _centered_collapse(text)
     
     def create_mirror_text(self, text: str) -> str:
         """Create mirrored/reflected text."""
-        return f"{text}\n{''.join(reversed(text))}"
-    
-    def create_scattered_text(self, text: str, scatter_intensity: float = 0.5) -> str:
-        """Scatter text across the space."""
-        words = text.split()
-        lines = [""] * min(len(words), 8)
-        
-        for i, word in enumerate(words[:8]):
-            indent = random.randint(0, int(40 * scatter_intensity))
-            lines[i] = " " * indent + word
-        
-        return "\n".join(lines)
+        return f"{text}\n{text[::-1]}"
+    
+    def create_scattered_text(self, text: str, scatter_intensity: float = 0.5, join_lines: bool = True):
+        """
+        Scatter text across the space.
+        Returns one string, or the list of lines when join_lines is False.
+        """
+        randint = self._rng.randint
+        max_indent = int(40 * scatter_intensity)
+        lines = [word.rjust(len(word) + randint(0, max_indent)) for word in text.split()[:8]]
+        return "\n".join(lines) if join_lines else lines
     
     def create_overlapping_text(self, text1: str, text2: str) -> str:
         """Overlap two texts (simulated)."""
@@ -323,17 +603,7 @@ class TypographyEngine:
     
     def create_box_text(self, text: str) -> str:
         """Put text in a box."""
-        lines = text.split('\n')
-        max_len = max(len(line) for line in lines) if lines else 0
-        max_len = min(max_len, 60)
-        
-        box = ["┌" + "─" * (max_len + 2) + "┐"]
-        for line in lines[:5]:  # Limit lines
-            padded = line[:max_len].ljust(max_len)
-            box.append(f"│ {padded} │")
-        box.append("└" + "─" * (max_len + 2) + "┘")
-        
-        return "\n".join(box)
+        return _box_text(text)
     
     def create_margin_notes(self, text: str) -> str:
         """Add marginal annotations."""
@@ -349,7 +619,7 @@ class TypographyEngine:
         result = []
         for i, line in enumerate(lines):
             result.append(line + ".")
-            if random.random() < 0.4 and i < len(notes):
+            if self._rng.random() < 0.4 and i < len(notes):
                 result.append(notes[i])
         
         return "\n".join(result)
@@ -360,7 +630,7 @@ class TypographyEngine:
         redacted_words = []
         
         for word in words:
-            if random.random() < redact_ratio:
+            if self._rng.random() < redact_ratio:
                 redacted_words.append("█" * len(word))
             else:
                 redacted_words.append(word)
@@ -369,36 +639,36 @@ class TypographyEngine:
     
     def create_fading_text(self, text: str) -> str:
         """Text that fades as it goes."""
-        chars = list(text)
-        fade_chars = ['░', '▒', '▓', '█']
+        fade_chars = self._FADE_CHARS
         
-        fade_point = len(chars) // 2
-        for i in range(fade_point, len(chars)):
-            if chars[i] not in [' ', '\n']:
-                fade_level = min(3, (i - fade_point) // 10)
-                if random.random() < 0.3:
-                    chars[i] = fade_chars[fade_level]
+        # Second half fades, one level darker every 10 characters; jump between
+        # the ~30% of positions that fire instead of rolling for each one
+        fade_point = len(text) // 2
+        chars = list(text[fade_point:])
+        for i in _geometric_hits(len(chars), 0.3, self._rng.random):
+            if chars[i] not in ' \n':
+                chars[i] = fade_chars[min(3, i // 10)]
         
-        return ''.join(chars)
+        return text[:fade_point] + ''.join(chars)
     
     def create_echo_text(self, word: str, echo_count: int = 3) -> str:
         """Create echoing effect for a word."""
+        rand = self._rng.random
         echoes = [word]
         for i in range(1, echo_count):
-            faded = ''.join(c if random.random() > (i * 0.3) else '░' for c in word)
+            faded = ''.join([c if rand() > (i * 0.3) else '░' for c in word])
             echoes.append(faded)
         return " ".join(echoes)
     
     def create_static_overlay(self, text: str) -> str:
         """Overlay static noise on text."""
-        static = ['▓', '▒', '░', '█']
-        chars = list(text)
-        
-        for i in range(len(chars)):
-            if chars[i] not in [' ', '\n'] and random.random() < 0.15:
-                chars[i] = random.choice(static)
+        static = self._STATIC_CHARS
+        rand, choice = self._rng.random, self._rng.choice
         
-        return ''.join(chars)
+        return ''.join([
+            choice(static) if char not in ' \n' and rand() < 0.15 else char
+            for char in text
+        ])
     
     def create_breathing_space(self, text: str) -> str:
         """Add expanding/contracting spaces (simulated)."""
@@ -413,234 +683,25 @@ class TypographyEngine:
     
     def create_terminal_glitch(self) -> str:
         """Create fake terminal artifacts."""
-        glitches = [
-            "^C^C^C",
-            "[CTRL+Z]",
-            ">>> ",
-            "$ ",
-            "ERROR: Segmentation fault",
-            "zsh: command not found:",
-            "Connection to localhost closed.",
-            "-bash: syntax error",
-            "kill -9 $$",
-        ]
-        return random.choice(glitches)
+        return self._rng.choice(_TERMINAL_GLITCHES)
     
     def create_cursor_artifact(self) -> str:
         """Fake cursor/typing indicators."""
-        artifacts = [
-            "_",
-            "▌",
-            "█",
-            "|",
-            "...",
-        ]
-        return random.choice(artifacts)
+        return self._rng.choice(_CURSOR_ARTIFACTS)
     
     def create_permission_denied(self) -> str:
         """Fake permission errors."""
-        errors = [
-            "Permission denied: you are not meant to read this",
-            "Access denied: file corrupted",
-            "Error 403: Narrative forbidden",
-            "rm: cannot remove 'reality': Permission denied",
-        ]
-        return random.choice(errors)
+        return self._rng.choice(_PERMISSION_ERRORS)
     
     def get_creepy_ascii_art(self, art_type: str = "random") -> str:
         """Get pre-made creepy ASCII art - expanded library."""
-        arts = {
-            "eyes": """
-        👁️        👁️
-            ‿
-            """,
-            "watching": """
-    👁️ 👁️ 👁️ 👁️ 👁️
-      👁️ 👁️ 👁️ 👁️
-        👁️ 👁️ 👁️
-            """,
-            "eyes_detailed": """
-      ╱─────╲  ╱─────╲
-     │  ◉◉  ││  ◉◉  │
-      ╲_____╱  ╲_____╱
-        │        │
-            """,
-            "many_eyes": """
-    (◉) (◉) (◉)
-      (◉) (◉)
-    (◉) (◉) (◉)
-       watching
-            """,
-            "static": """
-    ▓▒░░▒▓█▓▒░░▒▓
-    ░▒▓█▓▒░░▒▓█▓▒
-    ▓▒░░▒▓█▓▒░░▒▓
-            """,
-            "corruption": """
-    ◢◤◢◤◢◤◢◤◢◤
-    ◥◣◥◣◥◣◥◣◥◣
-    ◢◤◢◤◢◤◢◤◢◤
-            """,
-            "spiral": """
-        ╭─────╮
-        │  ◉  │
-        ╰─────╯
-            """,
-            "glitch": """
-    █▓▒░T̴H̷I̶N̸K̷█▒▓░
-    ░▒▓█E̴R̷R̶O̸R̷░▓▒█
-    ▓▒░█N̴O̷W̶░▒▓█▓
-            """,
-            "void": """
-    ░░░░░░░░░░░░░░
-    ░░░░░ ◉ ░░░░░
-    ░░░░░░░░░░░░░░
-            """,
-            "mouth": """
-        ╱▔▔▔▔▔╲
-        ▏  👄  ▕
-        ╲_____╱
-            """,
-            "mouth_teeth": """
-      ╱▔▔▔▔▔▔▔╲
-     │ ▲▼▲▼▲▼▲ │
-     │ ▼▲▼▲▼▲▼ │
-      ╲________╱
-            """,
-            "hands": """
-    🖐️         🖐️
-      🖐️     🖐️
-         🖐️
-            """,
-            "reaching_hand": """
-         ╱│╲
-        ╱ │ ╲
-       │  │  │
-       │  │  │
-      ╱│ ╱│╲ │╲
-     ╱ │╱ │ ╲│ ╲
-    reaching...
-            """,
-            "twisted_hand": """
-      ╱╲  ╱╲  ╱╲
-     ╱  ╲╱  ╲╱  ╲
-    │ too many  │
-     ╲ fingers ╱
-      ╲╲╲│╱╱╱
-            """,
-            "skeletal": """
-        ☠
-       ╱│╲
-      ╱ │ ╲
-        │
-       ╱ ╲
-      ╱   ╲
-            """,
-            "skull": """
-      ┌─────┐
-      │ ◉ ◉ │
-      │  ▼  │
-      │ ══  │
-      └─────┘
-            """,
-            "death_figure": """
-        ___
-       ╱   ╲
-      │ ☠ ☠ │
-       ╲___╱
-       ╱│││╲
-      ╱ │││ ╲
-            """,
-            "binary": """
-    01001000 01000101
-    01001100 01010000
-    00100001 00100001
-            """,
-            "flesh_mass": """
-      ╱╲╱╲╱╲
-     ╱▓▒░▒▓╲
-    │ pulsing │
-     ╲▒▓░▓▒╱
-      ╲╱╲╱╲╱
-            """,
-            "tendrils": """
-       ╱  │  ╲
-      ╱   │   ╲
-     ╱   ╱│╲   ╲
-    │   ╱ │ ╲   │
-     ╲ ╱  │  ╲ ╱
-      writhing
-            """,
-            "geometric_horror": """
-      ╱╲
-     ╱  ╲
-    ╱ ╱╲ ╲
-    ╲ ╲╱ ╱
-     ╲  ╱
-      ╲╱
-    impossible
-            """,
-            "doorway": """
-    ┌─────────┐
-    │         │
-    │    ?    │
-    │         │
-    │  ╱───╲  │
-    └──└───┘──┘
-            """,
-            "machine": """
-    ╔═══╦═══╗
-    ║ ◉ ║ ◉ ║
-    ╠═══╬═══╣
-    ║▓▒░│░▒▓║
-    ╚═══╩═══╝
-    computing
-            """,
-            "split_face": """
-      ╱◉ │ ◉╲
-     │   │   │
-     │ ══│══ │
-      ╲  │  ╱
-       ╲_│_╱
-            """,
-            "melting": """
-      ╱▔▔▔╲
-     │ ◉ ◉ │
-     │ drip │
-      ╲╲│╱╱
-       ▼▼▼
-            """,
-            "veins": """
-    ╱─╲  ╱─╲
-    │ ╱──╲ │
-    ╲─╲  ╱─╱
-      ╲──╱
-    pulsing
-            """,
-        }
-        
         if art_type == "random":
-            return random.choice(list(arts.values()))
-        return arts.get(art_type, arts["void"])
+            return self._rng.choice(_CREEPY_ART_VALUES)
+        return _CREEPY_ARTS.get(art_type, _VOID_ART)
     
     def get_computer_horror_message(self) -> str:
         """Meta messages about the terminal/computer."""
-        messages = [
-            "(your terminal is ${COLUMNS} characters wide)",
-            "(you've been sitting here for a while)",
-            "(your keyboard has fingerprints on the W, A, S, D keys)",
-            "(the fan on your computer just got louder)",
-            "(did your cursor just move on its own?)",
-            "(check your running processes)",
-            "(close this window and walk away)",
-            "(ps aux | grep fear)",
-            "(your screen is very bright in this dark room)",
-            "(someone can see your screen from behind you)",
-            "(cat /dev/urandom)",
-            "(this process is using 99% of your CPU)",
-            "(your battery: LOW)",
-        ]
-        return random.choice(messages)
+        return self._rng.choice(_COMPUTER_HORROR_MESSAGES)
     
     # ===== NEW EXPANDED EFFECTS =====
     
@@ -676,7 +737,7 @@ class TypographyEngine:
                 line_text = ' '.join(current_line)
                 padding = width - len(line_text)
                 if padding > 0:
-                    if random.random() < 0.5:
+                    if self._rng.random() < 0.5:
                         lines.append(" " * padding + line_text)  # Right
                     else:
                         lines.append(line_text + " " * padding)  # Left
@@ -694,7 +755,7 @@ class TypographyEngine:
         words = text.split()
         fragments = []
         for word in words:
-            if len(word) > 4 and random.random() < 0.4:
+            if len(word) > 4 and self._rng.random() < 0.4:
                 # Split word
                 mid = len(word) // 2
                 fragments.append(word[:mid] + "..." + word[mid:])
@@ -744,13 +805,10 @@ class TypographyEngine:
     
     def create_alternating_case(self, text: str) -> str:
         """Alternate between upper and lower case."""
-        result = []
-        for i, char in enumerate(text):
-            if char.isalpha():
-                result.append(char.upper() if i % 2 == 0 else char.lower())
-            else:
-                result.append(char)
-        return ''.join(result)
+        return ''.join([
+            (char.lower() if i & 1 else char.upper()) if char.isalpha() else char
+            for i, char in enumerate(text)
+        ])
     
     def create_word_stack(self, text: str) -> str:
         """Stack words vertically."""
@@ -762,8 +820,8 @@ class TypographyEngine:
         words = text.split()
         result = []
         for word in words:
-            if random.random() < 0.3:
-                brackets = random.choice(['[]', '()', '{}', '⟨⟩', '«»'])
+            if self._rng.random() < 0.3:
+                brackets = self._rng.choice(['[]', '()', '{}', '⟨⟩', '«»'])
                 result.append(f"{brackets[0]}{word}{brackets[1]}")
             else:
                 result.append(word)
@@ -774,8 +832,8 @@ class TypographyEngine:
         words = text.split()
         result = []
         for word in words:
-            if random.random() < 0.4:
-                dots = '.' * random.randint(1, 5)
+            if self._rng.random() < 0.4:
+                dots = '.' * self._rng.randint(1, 5)
                 result.append(word + dots)
             else:
                 result.append(word)
@@ -809,8 +867,8 @@ class TypographyEngine:
         result = []
         for word in words:
             result.append(word)
-            if random.random() < 0.5:
-                result.append(random.choice(static) * random.randint(1, 3))
+            if self._rng.random() < 0.5:
+                result.append(self._rng.choice(static) * self._rng.randint(1, 3))
         return ' '.join(result)
     
     def create_countdown_text(self, text: str) -> str:
@@ -831,5 +889,5 @@ class TypographyEngine:
             "━━━━━━━━━━━━━━━━━━━━━━━",
             "▬▬▬▬▬▬▬▬▬▬▬▬▬▬▬▬▬▬▬▬▬▬▬",
         ]
-        return random.choice(bars)
+        return self._rng.choice(bars)
 
@@ -38,6 +38,7 @@ All other mutations are AI-driven (visual effects, format shifts, etc.)
 
 import sys
 import os
+import copy
 import random
 import time
 from typing import Dict
@@ -60,6 +61,50 @@ from engine.mutations import MutationManager
 from engine.game_modes import GameMode, GameModeHandler
 from engine.system_horror import SystemHorrorEngine
 from config.prompts import get_revelation_modifiers, get_mutation_prompt_context
+from config.settings import SPECULATIVE_PREFETCH, SPECULATIVE_PREFETCH_LIMIT
+
+
+# Special typographic moments: effect -> TypographyEngine method. Effects without
+# a method fall back to the renderer's original special moments.
+_SPECIAL_MOMENT_METHODS = {
+    'wave': 'create_wave_text',
+    'staircase': 'create_staircase_text',
+    'fragmented': 'create_fragmented_text',
+    'layered': 'create_layered_text',
+    'reversed': 'create_reversed_sections',
+    'alternating': 'create_alternating_case',
+    'stack': 'create_word_stack',
+    'brackets': 'create_bracket_madness',
+    'double_vision': 'create_double_vision',
+    'interference': 'create_interference_pattern',
+    'countdown': 'create_countdown_text',
+    'justified_chaos': 'create_justified_chaos',
+    'trailing_dots': 'create_trailing_dots',
+    'box_frame': 'create_ascii_box_frame',
+}
+_SPECIAL_MOMENT_EFFECTS = (
+    'wave', 'staircase', 'fragmented', 'layered', 'reversed',
+    'alternating', 'stack', 'brackets', 'double_vision', 'interference',
+    'countdown', 'justified_chaos', 'trailing_dots', 'box_frame',
+    'mirror', 'falling', 'emphasis', 'whisper'
+)
+_SPECIAL_MOMENT_TEXTS = (
+    "you are being watched",
+    "this isn't real",
+    "turn back",
+    "the walls remember",
+    "who are you?",
+    "something is wrong",
+    "can you feel it",
+    "the narrator lies",
+    "you've been here before",
+    "this is not a game",
+    "wake up",
+    "they know",
+    "don't trust the choices",
+    "count the doors",
+    "remember your name",
+)
 
 
 class Game:
@@ -75,6 +120,7 @@ class Game:
             self.typography = TypographyEngine()
             self.session = SessionManager()
             self.truth = TruthTracker()
+            self.ai.session_salt = self.session.ghost_memory.get('sessions', 0)
             self.loader = ThematicLoader(self.renderer.console)
             self.endings = EndingsManager()
             self.scenario_gen = ScenarioGenerator(self.session.ghost_memory)
@@ -98,6 +144,12 @@ class Game:
     def run(self):
         """Run the game loop."""
         try:
+            # Get varied opening scenario and start writing it while the intro plays
+            scenario_data = self.scenario_gen.get_opening_scenario()
+            self.current_scenario_key = scenario_data.scenario.key
+            self.current_theme_key = scenario_data.theme.key
+            opening_pending = self.ai.start_opening(scenario_data)
+            
             # Opening sequence
             ghost_hint = self.session.get_opening_memory_hint()
             self.renderer.show_opening_title(ghost_hint)
@@ -107,18 +159,14 @@ class Game:
             if fragments:
                 self.renderer.show_ghost_memory(fragments)
             
-            # Get varied opening scenario
-            scenario_data = self.scenario_gen.get_opening_scenario()
-            self.current_scenario_key = scenario_data['scenario_key']
-            self.current_theme_key = scenario_data['theme_key']
-            
             # Show scenario title
             scenario_art = self.scenario_gen.get_scenario_title_art()
             self.renderer.show_scenario_title(scenario_art)
             
-            # Generate opening scene with scenario (with continuous animation)
-            with self.loader.start(revelation_level=0, choice_count=0):
-                opening = self.ai.generate_opening(scenario_data)
+            # Collect the opening scene (with continuous animation if it is still arriving)
+            with self.loader.start(revelation_level=0, choice_count=0) as loading:
+                opening_pending.follow(loading.feed)
+                opening = opening_pending.result()
             
             if not opening.get('error'):
                 self.story.set_narrative(opening['narrative'])
@@ -139,7 +187,8 @@ class Game:
                 ending = self.endings.check_for_ending(context)
                 if ending:
                     
-                    ending_result = self.ai.generate_ending_narrative(ending, context)
+                    with self.loader.start(revelation_level=self.truth.revelation_level, choice_count=context['choice_count'], message_override="manifesting..."):
+                        ending_art = self.ai.generate_ending_art(ending, context)
                     
                     # Show title
                     self.renderer.console.print(f"\n{'='*60}")
@@ -148,12 +197,14 @@ class Game:
                     self.renderer.console.print(f"{'='*60}\n")
                     
                     # Show final ASCII art
-                    if ending_result['ascii_art']:
-                        self.renderer.console.print(ending_result['ascii_art'], style="bold yellow", justify="center")
+                    if ending_art:
+                        self.renderer.console.print(ending_art, style="bold yellow", justify="center")
                         self.renderer.console.print()
                     
-                    # Show AI-generated ending narrative (escape any brackets)
-                    safe_narrative = ending_result['narrative'].replace('[', '\\[').replace(']', '\\]')
+                    # Show AI-generated ending narrative as it is written, then settle it (escape any brackets)
+                    with self.renderer.live_text(style="italic") as show_chunk:
+                        ending_narrative = self.ai.generate_ending_narrative(ending, context, on_text=show_chunk)
+                    safe_narrative = self.renderer.escape_markup(ending_narrative)
                     self.renderer.console.print(safe_narrative, style="italic")
                     self.renderer.console.print()
                     
@@ -196,7 +247,7 @@ class Game:
                 context['revelation_level'] = self.truth.revelation_level
                 
                 # Add scenario constraints to context for AI
-                context['scenario_constraints'] = scenario_data.get('ongoing_constraints', '')
+                context['scenario_constraints'] = scenario_data.ongoing_constraints
                 
                 # Check for rule mutations - SUBTLE INTEGRATION
                 active_mutations = self.mutations.check_mutation(context)
@@ -228,15 +279,18 @@ class Game:
                 
                 # Generate and show ASCII art at key moments (seamlessly integrated)
                 art = None
-                if self.ai.should_generate_art(context):
-                    # Generate art within loading state (seamless)
-                    with self.loader.start(revelation_level=self.truth.revelation_level, choice_count=context['choice_count'], message_override="manifesting..."):
-                        subject, mood = self.ai.get_art_subject(context)
-                        art = self.ai.generate_ascii_art(
-                            subject,
-                            mood,
-                            context['hidden_stats']['sanity']
-                        )
+                if opening.get('art_requested'):
+                    # Key moments usually get their art drawn in the same response as the scene
+                    art = opening.get('ascii_art')
+                    if not art:
+                        # Generate art within loading state (seamless)
+                        with self.loader.start(revelation_level=self.truth.revelation_level, choice_count=context['choice_count'], message_override="manifesting..."):
+                            subject, mood = self.ai.get_art_subject(context)
+                            art = self.ai.generate_ascii_art(
+                                subject,
+                                mood,
+                                context['hidden_stats']['sanity']
+                            )
                     
                     if art:
                         self.renderer.console.print("\n")
@@ -399,6 +453,10 @@ class Game:
                 if status_comment:
                     self.renderer.show_status_comment(status_comment)
                 
+                # Draw the breadcrumb once per turn so speculative and real prompts match
+                revelation_mods_level = self.truth.revelation_level
+                revelation_mods = get_revelation_modifiers(revelation_mods_level, breadcrumb_active)
+                
                 # Determine game mode based on active mutations
                 current_mode = GameMode.STANDARD
                 special_input_mutation = None
@@ -433,8 +491,8 @@ class Game:
                     
                     # Generate next scene
                     context['puzzle_answer'] = answer
-                    with self.loader.start(revelation_level=self.truth.revelation_level, choice_count=context['choice_count']):
-                        next_scene = self.ai.generate_scene(context)
+                    with self.loader.start(revelation_level=self.truth.revelation_level, choice_count=context['choice_count']) as loading:
+                        next_scene = self.ai.generate_scene(context, on_text=loading.feed)
                 
                 elif current_mode == GameMode.TEXT_PARSER:
                     # Text parser mode
@@ -446,8 +504,8 @@ class Game:
                     
                     # Generate next scene
                     context['parser_command'] = parsed
-                    with self.loader.start(revelation_level=self.truth.revelation_level, choice_count=context['choice_count']):
-                        next_scene = self.ai.generate_scene(context)
+                    with self.loader.start(revelation_level=self.truth.revelation_level, choice_count=context['choice_count']) as loading:
+                        next_scene = self.ai.generate_scene(context, on_text=loading.feed)
                 
                 elif current_mode == GameMode.TIME_PRESSURE:
                     # Timed choice mode
@@ -464,15 +522,13 @@ class Game:
                     choice_idx = 0
                     
                     context['coordinates'] = coords
-                    with self.loader.start(revelation_level=self.truth.revelation_level, choice_count=context['choice_count']):
-                        next_scene = self.ai.generate_scene(context)
+                    with self.loader.start(revelation_level=self.truth.revelation_level, choice_count=context['choice_count']) as loading:
+                        next_scene = self.ai.generate_scene(context, on_text=loading.feed)
                 
                 else:
                     # STANDARD mode - normal choices
-                    choices = opening.get('choices', [])
-                    if not choices or len(choices) < 2:
-                        choices = ["Continue forward", "Look around carefully", "Pause and consider options"]
-                        print("[DEBUG] Using fallback choices - AI response invalid")
+                    # _parse_response and the error paths always supply at least two choices
+                    choices = opening['choices']
                     
                     # ===== MUTATION ENFORCEMENT =====
                     # Apply mutations that need code-level enforcement
@@ -538,12 +594,19 @@ class Game:
                     # Temporal Loop - repeat previous choices
                     elif any(m.key == 'temporal_loop' for m in active_mutations):
                         if len(self.story.choice_history) >= 3:
-                            choices = self.story.choice_history[-3:]
+                            choices = list(self.story.choice_history)[-3:]
                             self.renderer.console.print(f"\n[dim italic yellow]You've done this before...[/]\n")
                     
                     # Show choices (unless forced_random already handled it)
                     if not any(m.key == 'forced_random' for m in active_mutations):
                         self.renderer.show_choices(choices, intensity)
+                        
+                        # Start on the likely next scenes while the player decides
+                        if SPECULATIVE_PREFETCH:
+                            self.ai.prefetch_scenes([
+                                self._speculative_context(choice, i, revelation_mods)
+                                for i, choice in enumerate(choices[:SPECULATIVE_PREFETCH_LIMIT])
+                            ])
                     
                     # Get player input (with secret word detection)
                     # Unless forced_random already set it
@@ -560,6 +623,34 @@ class Game:
                 
                 # Check for choice patterns
                 pattern_response = self.truth.detect_choice_pattern(choice_idx + 1)
+                
+                # Process choice (stores danger level for later display)
+                self.story.process_choice(chosen_text, choice_idx)
+                
+                # Keep ghost memory current in case the session dies mid-story
+                self.session.queue_ghost_memory(
+                    self.story.choice_history,
+                    self.story.get_state_summary(),
+                    self.truth.get_state_dict(),
+                    scenario_used=self.scenario_gen.current_scenario_id()
+                )
+                
+                # Check if player chose obvious trap (classic CYOA punishment)
+                trap_chosen = self.story.detect_trap_choice(chosen_text)
+                if trap_chosen:
+                    self.story.apply_trap_consequences()
+                
+                # The next scene only depends on state settled above, so request it
+                # now and let it generate through the dramatic pauses below
+                if current_mode == GameMode.STANDARD or current_mode == GameMode.TIME_PRESSURE:
+                    current_context = self.story.get_context()
+                    current_context['revelation_level'] = self.truth.revelation_level
+                    if self.truth.revelation_level != revelation_mods_level:
+                        # A secret word moved the revelation level while the player chose
+                        revelation_mods = get_revelation_modifiers(self.truth.revelation_level, breadcrumb_active)
+                    current_context['revelation_context'] = revelation_mods
+                    self.ai.start_scene(current_context)
+                
                 if pattern_response:
                     self.renderer.console.print(f"\n[dim italic yellow]{pattern_response}[/]")
                     time.sleep(1.5)
@@ -575,25 +666,15 @@ class Game:
                         self.renderer.console.print(f"[dim italic]No, no, you're right. Option {choice_idx + 1}. Definitely.[/]\n")
                         time.sleep(0.8)
                 
-                # Process choice (stores danger level for later display)
-                self.story.process_choice(chosen_text, choice_idx)
-                
-                # Check if player chose obvious trap (classic CYOA punishment)
-                if self.story.detect_trap_choice(chosen_text):
-                    self.story.apply_trap_consequences()
+                if trap_chosen:
                     # Show immediate feedback
                     self.renderer.console.print(f"\n[bold red]That was... unwise.[/]")
                     time.sleep(1.2)
                 
-                # Generate next scene (if not already generated by special input mode)
+                # Collect the next scene (if not already generated by special input mode)
                 if current_mode == GameMode.STANDARD or current_mode == GameMode.TIME_PRESSURE:
-                    current_context = self.story.get_context()
-                    current_context['revelation_level'] = self.truth.revelation_level
-                    revelation_mods = get_revelation_modifiers(self.truth.revelation_level, breadcrumb_active)
-                    current_context['revelation_context'] = revelation_mods
-                    
-                    with self.loader.start(revelation_level=self.truth.revelation_level, choice_count=context['choice_count']):
-                        next_scene = self.ai.generate_scene(current_context)
+                    with self.loader.start(revelation_level=self.truth.revelation_level, choice_count=context['choice_count']) as loading:
+                        next_scene = self.ai.generate_scene(current_context, on_text=loading.feed)
                 
                 # next_scene already generated for special modes
                 if next_scene.get('error'):
@@ -624,11 +705,7 @@ class Game:
                     self.renderer.console.print(f"\n{self.typography.create_glitch_bars()}\n", style="dim")
             
             # Save ghost memory on exit (with truth state)
-            self.session.save_ghost_memory(
-                self.story.choice_history,
-                self.story.get_state_summary(),
-                self.truth.get_state_dict()
-            )
+            self._save_ghost_memory()
             
             self.renderer.console.print("\n[dim]Session saved to ghost memory.[/]")
             self.renderer.console.print("[dim]You can run this again. It will be different.[/]")
@@ -639,16 +716,12 @@ class Game:
             # If we get here, user really wants to quit (third Ctrl+C)
             self.renderer.console.print("\n\n[dim]The story releases you.[/]")
             # Still save ghost memory
-            self.session.save_ghost_memory(
-                self.story.choice_history,
-                self.story.get_state_summary(),
-                self.truth.get_state_dict()
-            )
+            self._save_ghost_memory()
             sys.exit(0)
         
         except Exception as e:
             # Escape the error message to prevent Rich markup conflicts
-            error_msg = str(e).replace('[', '\\[').replace(']', '\\]')
+            error_msg = self.renderer.escape_markup(str(e))
             self.renderer.console.print(f"\n\n[bold red]CRITICAL ERROR:[/] {error_msg}")
             self.renderer.console.print("[dim]The narrator has stopped responding.[/]")
             
@@ -656,75 +729,50 @@ class Game:
             import traceback
             print("\nFull traceback:")
             print(traceback.format_exc())
+            
+            # Keep whatever this session got through
+            try:
+                self._save_ghost_memory()
+            except Exception:
+                pass  # The original error is what matters here
             sys.exit(1)
     
+    def _save_ghost_memory(self):
+        """Queue the final session state and wait until it is on disk."""
+        self.session.queue_ghost_memory(
+            self.story.choice_history,
+            self.story.get_state_summary(),
+            self.truth.get_state_dict(),
+            scenario_used=self.scenario_gen.current_scenario_id()
+        )
+        self.session.flush_ghost_memory()
+    
+    def _speculative_context(self, choice_text: str, choice_idx: int, revelation_mods: str) -> Dict:
+        """Build the scene context the game would send if the player picked this choice."""
+        # A copy carries the engine's RNG state, so the real turn produces the same context
+        story = copy.deepcopy(self.story)
+        story.process_choice(choice_text, choice_idx)
+        if story.detect_trap_choice(choice_text):
+            story.apply_trap_consequences()
+        
+        context = story.get_context()
+        context['revelation_level'] = self.truth.revelation_level
+        context['revelation_context'] = revelation_mods
+        return context
+    
     def _trigger_special_moment(self, context: Dict):
         """Trigger special typographic moments - MASSIVELY EXPANDED."""
-        import random
-        
         # Choose from many more effect types
-        effects = [
-            'wave', 'staircase', 'fragmented', 'layered', 'reversed',
-            'alternating', 'stack', 'brackets', 'double_vision', 'interference',
-            'countdown', 'justified_chaos', 'trailing_dots', 'box_frame',
-            'mirror', 'falling', 'emphasis', 'whisper'
-        ]
-        
-        effect = random.choice(effects)
-        
-        texts = [
-            "you are being watched",
-            "this isn't real",
-            "turn back",
-            "the walls remember",
-            "who are you?",
-            "something is wrong",
-            "can you feel it",
-            "the narrator lies",
-            "you've been here before",
-            "this is not a game",
-            "wake up",
-            "they know",
-            "don't trust the choices",
-            "count the doors",
-            "remember your name",
-        ]
-        
-        text = random.choice(texts)
+        effect = random.choice(_SPECIAL_MOMENT_EFFECTS)
+        text = random.choice(_SPECIAL_MOMENT_TEXTS)
         
         # Apply the chosen effect
-        if effect == 'wave':
-            result = self.typography.create_wave_text(text)
-        elif effect == 'staircase':
-            result = self.typography.create_staircase_text(text)
-        elif effect == 'fragmented':
-            result = self.typography.create_fragmented_text(text)
-        elif effect == 'layered':
-            result = self.typography.create_layered_text(text)
-        elif effect == 'reversed':
-            result = self.typography.create_reversed_sections(text)
-        elif effect == 'alternating':
-            result = self.typography.create_alternating_case(text)
-        elif effect == 'stack':
-            result = self.typography.create_word_stack(text)
-        elif effect == 'brackets':
-            result = self.typography.create_bracket_madness(text)
-        elif effect == 'double_vision':
-            result = self.typography.create_double_vision(text)
-        elif effect == 'interference':
-            result = self.typography.create_interference_pattern(text)
-        elif effect == 'countdown':
-            result = self.typography.create_countdown_text(text)
-        elif effect == 'justified_chaos':
-            result = self.typography.create_justified_chaos(text)
-        elif effect == 'trailing_dots':
-            result = self.typography.create_trailing_dots(text)
-        elif effect == 'box_frame':
-            result = self.typography.create_ascii_box_frame(text)
-        else:
+        method = _SPECIAL_MOMENT_METHODS.get(effect)
+        if method is None:
             # Fallback to original special moments
             self.renderer.show_special_moment(effect, text)
             return
+        result = getattr(self.typography, method)(text)
         
         # Display the effect
         self.renderer.console.print(f"\n{result}\n", style="dim italic yellow")
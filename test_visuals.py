@@ -41,13 +41,13 @@ def main():
     
     # Test 4: Scattered text (panic)
     renderer.console.print("\n[bold]4. Scattered Text (Panic Effect):[/]")
-    scattered = typo.create_scattered_text("Everything breaks apart you cannot hold the pieces", width=60)
+    scattered = typo.create_scattered_text("Everything breaks apart you cannot hold the pieces", join_lines=False)
     renderer.show_scattered_text(scattered)
     time.sleep(1.5)
     
     # Test 5: Spiral text
     renderer.console.print("\n[bold]5. Spiraling Text (Paranoia Effect):[/]")
-    spiral = typo.create_spiral_text("Deeper and deeper into the spiral you go without return", inward=True)
+    spiral = typo.create_spiral_text("Deeper and deeper into the spiral you go without return", join_lines=False)
     renderer.show_spiral_text(spiral)
     time.sleep(1.5)
     